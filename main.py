@@ -11,22 +11,22 @@ Usage:
 import argparse
 import asyncio
 import logging
+import re
 import sys
 from datetime import date, datetime
 from zoneinfo import ZoneInfo
 
 from dotenv import load_dotenv
 
-from src.bot import ShulchanAruchYomiBot
 from src.config import Config
 from src.formatter import format_daily_message
-from src.sefaria import SefariaClient
-from src.selector import HalachaSelector
 
 logger = logging.getLogger(__name__)
 
 ISRAEL_TZ = ZoneInfo("Asia/Jerusalem")
 
+_TAG_RE = re.compile(r"<[^>]+>")
+
 
 def is_broadcast_hour() -> bool:
     """Check if it's currently the 3am hour in Israel."""
@@ -71,7 +71,8 @@ Examples:
 
 def preview_message(date_override: str | None = None) -> None:
     """Preview today's message without sending."""
-    import re
+    from src.sefaria import SefariaClient
+    from src.selector import HalachaSelector
 
     client = SefariaClient()
     selector = HalachaSelector(client)
@@ -85,16 +86,21 @@ def preview_message(date_override: str | None = None) -> None:
     print(f"Preview for: {target_date}")
     print("=" * 60)
 
-    pair = selector.get_daily_pair(target_date)
+    try:
+        pair = selector.get_daily_pair(target_date)
+    finally:
+        SefariaClient.close_shared_session()
+
     if pair:
         messages = format_daily_message(pair, target_date)
+        total_chars = 0
         for i, msg in enumerate(messages, 1):
-            readable = re.sub(r"<[^>]+>", "", msg)
+            total_chars += len(msg)
+            readable = _TAG_RE.sub("", msg)
             print(f"\n--- Message {i} ---")
             print(readable)
 
         print(f"\n{'=' * 60}")
-        total_chars = sum(len(m) for m in messages)
         print(f"Total messages: {len(messages)}")
         print(f"Total characters: {total_chars}")
         print(f"First halacha: {pair.first.reference}")
@@ -106,22 +112,46 @@ def preview_message(date_override: str | None = None) -> None:
 
 async def send_broadcast(config: Config) -> bool:
     """Send the daily broadcast."""
+    from src.bot import ShulchanAruchYomiBot
+    from src.sefaria import SefariaClient
+    from src.telegram_client import shutdown_bots
+
     bot = ShulchanAruchYomiBot(config)
-    return await bot.send_daily_broadcast()
+    try:
+        return await bot.send_daily_broadcast()
+    finally:
+        await shutdown_bots()
+        SefariaClient.close_shared_session()
 
 
 def run_server(config: Config) -> None:
     """Run the bot in interactive mode."""
+    from src.bot import ShulchanAruchYomiBot
+    from src.sefaria import SefariaClient
+
     bot = ShulchanAruchYomiBot(config)
-    bot.run_polling()
+    try:
+        bot.run_polling()
+    finally:
+        SefariaClient.close_shared_session()
 
 
 def main() -> int:
     """Main entry point."""
-    load_dotenv()
-
     args = parse_args()
 
+    # Hourly cron runs exit here 23 times a day, so skip before loading
+    # config or importing the Telegram/TTS stack.
+    if not (args.serve or args.preview or args.force) and not is_broadcast_hour():
+        israel_now = datetime.now(ISRAEL_TZ)
+        print(
+            f"Skipping broadcast: Israel time is {israel_now.strftime('%H:%M')} "
+            f"(not 3am). DST handling - other scheduled run will send."
+        )
+        return 0
+
+    load_dotenv()
+
     if args.preview:
         preview_message(args.date)
         return 0
@@ -140,22 +170,14 @@ def main() -> int:
     if args.serve:
         run_server(config)
         return 0
+
+    logger.info("Sending daily broadcast...")
+    success = asyncio.run(send_broadcast(config))
+    if success:
+        logger.info("Broadcast completed successfully!")
     else:
-        if not args.force and not is_broadcast_hour():
-            israel_now = datetime.now(ISRAEL_TZ)
-            logger.info(
-                f"Skipping broadcast: Israel time is {israel_now.strftime('%H:%M')} "
-                f"(not 3am). DST handling - other scheduled run will send."
-            )
-            return 0
-
-        logger.info("Sending daily broadcast...")
-        success = asyncio.run(send_broadcast(config))
-        if success:
-            logger.info("Broadcast completed successfully!")
-        else:
-            logger.error("Broadcast failed!")
-        return 0 if success else 1
+        logger.error("Broadcast failed!")
+    return 0 if success else 1
 
 
 if __name__ == "__main__":
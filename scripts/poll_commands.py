@@ -6,10 +6,17 @@ It polls for new updates, handles commands, and persists state.
 """
 
 import asyncio
+import fcntl
 import json
 import logging
+import os
 import sys
+import tempfile
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -22,8 +29,17 @@ from src.commands import (
 from src.config import Config
 from src.sefaria import SefariaClient
 from src.selector import HalachaSelector
-from src.subscribers import add_subscriber, is_subscribed, remove_subscriber
-from src.tts import is_tts_enabled, send_voice_for_pair
+from src.subscribers import (
+    add_subscriber,
+    batch_updates,
+    is_subscribed,
+    remove_subscriber,
+)
+from src.tts import (
+    is_tts_enabled,
+    send_generated_voice,
+    start_daily_voice_generation,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -33,77 +49,147 @@ logger = logging.getLogger(__name__)
 
 STATE_DIR = Path(__file__).parent.parent / ".github" / "state"
 STATE_FILE = STATE_DIR / "last_update_id.json"
+STATE_LOCK_FILE = STATE_DIR / ".lock"
+
+# Only the file's contents must hit disk before the rename; fdatasync skips
+# the metadata flush where the platform has it
+_sync_data = getattr(os, "fdatasync", os.fsync)
+
+
+@contextmanager
+def _state_lock(operation: int) -> Iterator[None]:
+    """Hold an flock on the state directory's lock file."""
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(STATE_LOCK_FILE, "w") as lock:
+        fcntl.flock(lock, operation)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
 
 
 def load_state() -> int:
     """Load last processed update ID from state file."""
-    if STATE_FILE.exists():
+    with _state_lock(fcntl.LOCK_SH):
         try:
-            data = json.loads(STATE_FILE.read_text())
+            data = json.loads(STATE_FILE.read_bytes())
             return int(data.get("last_update_id", 0))
-        except (json.JSONDecodeError, KeyError, ValueError):
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError):
             return 0
-    return 0
 
 
 def save_state(last_update_id: int) -> None:
-    """Save last processed update ID to state file."""
-    STATE_DIR.mkdir(parents=True, exist_ok=True)
-    STATE_FILE.write_text(json.dumps({"last_update_id": last_update_id}, indent=2))
+    """Save last processed update ID to state file.
+
+    Writes a temp file and renames it over the state file, so a killed run
+    never leaves a truncated file that would reset the offset to 0.
+    """
+    payload = json.dumps({"last_update_id": last_update_id}, indent=2).encode()
+    with _state_lock(fcntl.LOCK_EX):
+        fd, tmp_path = tempfile.mkstemp(
+            dir=STATE_DIR, prefix=".last_update_", suffix=".json.tmp"
+        )
+        try:
+            os.write(fd, payload)
+            _sync_data(fd)
+        finally:
+            os.close(fd)
+        try:
+            os.replace(tmp_path, STATE_FILE)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
     logger.info(f"Saved state: last_update_id={last_update_id}")
 
 
+class _DailyVoice:
+    """Today's voice for one poll run, generated at most once.
+
+    Every /start and /today in the run awaits the same task, so a batch of
+    commands synthesizes each halacha once however many chats asked.
+    """
+
+    def __init__(self, selector: HalachaSelector, config: Config | None) -> None:
+        self._selector = selector
+        self._config = config
+        self._task: asyncio.Task[list[tuple[str, bytes, str]]] | None = None
+
+    def start(self) -> asyncio.Task[list[tuple[str, bytes, str]]] | None:
+        """Get the shared voice task, starting it on first use.
+
+        Returns None when TTS is off.
+        """
+        if not is_tts_enabled(self._config):
+            return None
+        if self._task is None:
+            self._task = start_daily_voice_generation(
+                self._selector, self._config.google_tts_credentials_json
+            )
+        return self._task
+
+    def cancel(self) -> None:
+        """Stop generation that no chat is waiting for any more."""
+        if self._task is not None:
+            self._task.cancel()
+
+
+async def _send_daily(
+    bot: object,
+    chat_id: int,
+    messages: list[str],
+    voice_task: asyncio.Task[list[tuple[str, bytes, str]]] | None,
+) -> None:
+    """Send the daily text, then the voice generated alongside it."""
+    for msg in messages:
+        await bot.send_message(  # type: ignore[attr-defined]
+            chat_id=chat_id,
+            text=msg,
+            parse_mode="HTML",
+            disable_web_page_preview=True,
+        )
+
+    if voice_task:
+        await send_generated_voice(bot, chat_id, voice_task)
+
+
 async def handle_command(
     bot: object,
     chat_id: int,
     command: str,
     selector: HalachaSelector,
     config: Config | None = None,
+    voice: _DailyVoice | None = None,
 ) -> None:
-    """Handle a single command."""
+    """Handle a single command.
+
+    ``voice`` is the run's shared voice generation; without one, the
+    command generates its own.
+    """
+    if voice is None:
+        voice = _DailyVoice(selector, config)
     try:
         if command == "/start":
             was_new = add_subscriber(chat_id)
             if was_new:
                 logger.info(f"Auto-subscribed new user {chat_id}")
 
-            messages = get_start_messages(selector)
-            for msg in messages:
-                await bot.send_message(  # type: ignore[attr-defined]
-                    chat_id=chat_id,
-                    text=msg,
-                    parse_mode="HTML",
-                    disable_web_page_preview=True,
-                )
+            await _send_daily(
+                bot,
+                chat_id,
+                get_start_messages(selector),
+                voice.start(),
+            )
             logger.info(f"Sent start messages to {chat_id}")
 
-            if is_tts_enabled(config):
-                assert config is not None
-                pair = selector.get_daily_pair()
-                if pair:
-                    await send_voice_for_pair(
-                        bot, pair, chat_id, config.google_tts_credentials_json
-                    )
-
         elif command == "/today":
-            messages = get_today_messages(selector)
-            for msg in messages:
-                await bot.send_message(  # type: ignore[attr-defined]
-                    chat_id=chat_id,
-                    text=msg,
-                    parse_mode="HTML",
-                    disable_web_page_preview=True,
-                )
+            await _send_daily(
+                bot,
+                chat_id,
+                get_today_messages(selector),
+                voice.start(),
+            )
             logger.info(f"Sent today's halachot to {chat_id}")
 
-            if is_tts_enabled(config):
-                assert config is not None
-                pair = selector.get_daily_pair()
-                if pair:
-                    await send_voice_for_pair(
-                        bot, pair, chat_id, config.google_tts_credentials_json
-                    )
-
         elif command in ("/info", "/about", "/help"):
             await bot.send_message(  # type: ignore[attr-defined]
                 chat_id=chat_id,
@@ -159,11 +245,46 @@ async def handle_command(
             pass
 
 
+async def _get_updates_with_retry(
+    bot: object, last_update_id: int, max_retries: int = 3
+) -> list[Any] | None:
+    """Fetch new updates, retrying transient failures.
+
+    Returns None when every attempt failed; the next scheduled run retries.
+    """
+    from telegram.error import Conflict, NetworkError, TimedOut
+
+    for attempt in range(1, max_retries + 1):
+        try:
+            updates: list[Any] = await bot.get_updates(  # type: ignore[attr-defined]
+                offset=last_update_id + 1,
+                timeout=10,
+                allowed_updates=["message"],
+            )
+            return updates
+        # Conflict: a webhook was still set while its deletion was in flight
+        except (TimedOut, NetworkError, Conflict) as e:
+            if attempt < max_retries:
+                wait = attempt * 2
+                logger.warning(
+                    f"get_updates attempt {attempt}/{max_retries} failed: {e}. "
+                    f"Retrying in {wait}s..."
+                )
+                await asyncio.sleep(wait)
+            else:
+                logger.warning(
+                    f"get_updates failed after {max_retries} attempts: {e}. "
+                    "Will retry on next scheduled run."
+                )
+    return None
+
+
 async def poll_and_respond() -> bool:
     """Poll for updates and respond to commands."""
     try:
-        from telegram import Bot
         from telegram.error import NetworkError, TimedOut
+
+        from src.telegram_client import get_bot, shutdown_bots
     except ImportError as e:
         logger.error(f"telegram module not available: {e}")
         return False
@@ -188,64 +309,76 @@ async def poll_and_respond() -> bool:
     last_update_id = load_state()
     logger.info(f"Starting poll with offset {last_update_id + 1}")
 
-    max_retries = 3
-    async with Bot(token=config.telegram_bot_token) as bot:
+    bot = await get_bot(config.telegram_bot_token)
+    try:
+        # Clearing the webhook and fetching updates are independent, so
+        # overlap the two round trips instead of running them back to back.
+        delete_task = asyncio.create_task(
+            bot.delete_webhook(drop_pending_updates=False)
+        )
         try:
-            webhook_deleted = await bot.delete_webhook(drop_pending_updates=False)
-            if webhook_deleted:
-                logger.info("Webhook cleared, ready for polling")
-        except (TimedOut, NetworkError) as e:
-            logger.warning(f"Could not clear webhook (will retry on next run): {e}")
-
-        updates = None
-        for attempt in range(1, max_retries + 1):
+            updates = await _get_updates_with_retry(bot, last_update_id)
+        finally:
             try:
-                updates = await bot.get_updates(
-                    offset=last_update_id + 1,
-                    timeout=10,
-                    allowed_updates=["message"],
-                )
-                break
+                if await delete_task:
+                    logger.info("Webhook cleared, ready for polling")
             except (TimedOut, NetworkError) as e:
-                if attempt < max_retries:
-                    wait = attempt * 2
-                    logger.warning(
-                        f"get_updates attempt {attempt}/{max_retries} failed: {e}. "
-                        f"Retrying in {wait}s..."
-                    )
-                    await asyncio.sleep(wait)
-                else:
-                    logger.warning(
-                        f"get_updates failed after {max_retries} attempts: {e}. "
-                        "Will retry on next scheduled run."
-                    )
-                    return True
+                logger.warning(f"Could not clear webhook (will retry on next run): {e}")
 
+        if updates is None:
+            return True
         if not updates:
             logger.info("No new updates")
             return True
 
         logger.info(f"Processing {len(updates)} update(s)")
 
-        new_last_update_id = last_update_id
-        for update in updates:
-            new_last_update_id = max(new_last_update_id, update.update_id)
+        new_last_update_id = max(
+            last_update_id, max(update.update_id for update in updates)
+        )
 
+        # Group commands per chat: chats are served concurrently, but each
+        # chat's commands still run in the order they were sent.
+        by_chat: dict[int, list[str]] = defaultdict(list)
+        for update in updates:
             if not update.message or not update.message.text:
                 continue
 
             text = update.message.text.strip()
-            chat_id = update.message.chat_id
-
             if text.startswith("/"):
                 command = text.split()[0].split("@")[0].lower()
+                by_chat[update.message.chat_id].append(command)
+
+        # One voice generation for the whole batch, awaited by every chat
+        voice = _DailyVoice(selector, config)
+
+        async def _drain(chat_id: int, commands: list[str]) -> None:
+            for command in commands:
                 logger.info(f"Processing command '{command}' from chat {chat_id}")
-                await handle_command(bot, chat_id, command, selector, config)
+                await handle_command(bot, chat_id, command, selector, config, voice)
+
+        # Subscription changes from the whole batch are saved in one write
+        with batch_updates():
+            try:
+                results = await asyncio.gather(
+                    *(
+                        _drain(chat_id, commands)
+                        for chat_id, commands in by_chat.items()
+                    ),
+                    return_exceptions=True,
+                )
+            finally:
+                voice.cancel()
+        for chat_id, outcome in zip(by_chat, results, strict=True):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed processing commands for {chat_id}: {outcome}")
 
         if new_last_update_id > last_update_id:
             save_state(new_last_update_id)
 
         return True
+    finally:
+        await shutdown_bots()
 
 
 def main() -> None:
@@ -257,6 +390,8 @@ def main() -> None:
     except Exception as e:
         logger.warning(f"Poll encountered error (non-fatal): {e}")
         success = True
+    finally:
+        SefariaClient.close_shared_session()
 
     if success:
         logger.info("=== Poll completed successfully ===")
@@ -1,5 +1,7 @@
 """Telegram bot implementation."""
 
+import asyncio
+import functools
 import logging
 from datetime import date, time
 from zoneinfo import ZoneInfo
@@ -16,16 +18,34 @@ from telegram.ext import (
 
 from .commands import get_info_message, get_start_messages
 from .config import Config
-from .formatter import format_daily_message
+from .formatter import (
+    coalesce_messages,
+    format_daily_message,
+    format_unified_message,
+)
 from .models import DailyPair
 from .sefaria import SefariaClient
 from .selector import HalachaSelector
 from .subscribers import load_subscribers
-from .tts import HebrewTTSClient, is_tts_enabled, send_voice_for_pair
+from .telegram_client import RateLimiter, get_bot, send_paced
+from .tts import (
+    is_tts_enabled,
+    send_generated_voice,
+    send_voice_for_pair,
+    send_voices,
+    start_daily_voice_generation,
+    start_voice_generation,
+)
 from .unified import is_unified_channel_enabled, publish_text_to_unified_channel
 
 logger = logging.getLogger(__name__)
 
+# Sends per second during a broadcast, under Telegram's ~30 msg/s global limit
+BROADCAST_RATE = 25.0
+
+# Subscriber sends in flight at once; the rate limiter sets the pace
+BROADCAST_CONCURRENCY = 25
+
 
 class ShulchanAruchYomiBot:
     """Telegram bot for daily Shulchan Aruch."""
@@ -80,23 +100,27 @@ class ShulchanAruchYomiBot:
 
         messages = get_start_messages(self.selector)
 
-        for msg in messages:
-            await update.message.reply_text(
-                msg, parse_mode=ParseMode.HTML, disable_web_page_preview=True
+        # Start TTS before the text goes out so synthesis overlaps delivery;
+        # the pair lookup runs inside the task, off the text's path
+        voice_task = None
+        if is_tts_enabled(self.config):
+            voice_task = start_daily_voice_generation(
+                self.selector,
+                credentials_json=self.config.google_tts_credentials_json,
             )
 
-        if is_tts_enabled(self.config):
-            try:
-                pair = self.selector.get_daily_pair()
-                if pair:
-                    await send_voice_for_pair(
-                        context.bot,
-                        pair,
-                        update.message.chat_id,
-                        credentials_json=self.config.google_tts_credentials_json,
-                    )
-            except Exception as e:
-                logger.warning(f"Voice message failed for {user_id}: {e}")
+        try:
+            for msg in messages:
+                await update.message.reply_text(
+                    msg, parse_mode=ParseMode.HTML, disable_web_page_preview=True
+                )
+        except BaseException:
+            if voice_task:
+                voice_task.cancel()
+            raise
+
+        if voice_task:
+            await send_generated_voice(context.bot, update.message.chat_id, voice_task)
 
     async def start_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -144,7 +168,7 @@ class ShulchanAruchYomiBot:
         """Send daily broadcast via scheduled job."""
         logger.info("Running scheduled daily broadcast...")
         try:
-            pair = self.selector.get_daily_pair(date.today())
+            pair = await self.selector.aget_daily_pair(date.today())
             if not pair:
                 logger.error("Failed to get daily pair for scheduled broadcast")
                 return
@@ -193,62 +217,83 @@ class ShulchanAruchYomiBot:
         logger.info(f"Broadcasting to channel={channel_id}")
 
         try:
-            pair = self.selector.get_daily_pair(date.today())
+            pair = await self.selector.aget_daily_pair(date.today())
             if not pair:
                 logger.error("Failed to get daily pair")
                 return False
 
-            messages = format_daily_message(pair, date.today())
+            messages = coalesce_messages(format_daily_message(pair, date.today()))
             logger.info(f"Prepared {len(messages)} messages to send")
 
-            subscribers = load_subscribers()
-            subscribers.discard(int(channel_id) if channel_id else 0)
+            subscribers = load_subscribers() - {int(channel_id) if channel_id else 0}
             logger.info(
                 f"Will broadcast to channel + {len(subscribers)} individual subscribers"
             )
 
-            bot = Bot(token=self.config.telegram_bot_token)
-            async with bot:
-                for i, msg in enumerate(messages, 1):
-                    result = await bot.send_message(
+            bot = await get_bot(self.config.telegram_bot_token)
+            # Text and voice sends to every chat share one pace
+            limiter = RateLimiter(BROADCAST_RATE)
+
+            # The channel goes first: if it fails, nobody has been messaged
+            # yet and the run can be retried without sending duplicates
+            for i, msg in enumerate(messages, 1):
+                result = await send_paced(
+                    limiter,
+                    functools.partial(
+                        bot.send_message,
                         chat_id=channel_id,
                         text=msg,
                         parse_mode=ParseMode.HTML,
                         disable_web_page_preview=True,
+                    ),
+                )
+                if result and result.message_id:
+                    logger.info(
+                        f"Channel message {i}/{len(messages)} sent "
+                        f"(message_id={result.message_id})"
                     )
-                    if result and result.message_id:
-                        logger.info(
-                            f"Channel message {i}/{len(messages)} sent "
-                            f"(message_id={result.message_id})"
-                        )
-                    else:
-                        logger.error(f"Channel message {i}/{len(messages)} failed")
-                        return False
-
-                failed_subscribers = []
-                for subscriber_id in subscribers:
-                    try:
-                        for msg in messages:
-                            await bot.send_message(
+                else:
+                    logger.error(f"Channel message {i}/{len(messages)} failed")
+                    return False
+
+            semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+
+            async def _send_to_one(subscriber_id: int) -> None:
+                async with semaphore:
+                    for msg in messages:
+                        await send_paced(
+                            limiter,
+                            functools.partial(
+                                bot.send_message,
                                 chat_id=subscriber_id,
                                 text=msg,
                                 parse_mode=ParseMode.HTML,
                                 disable_web_page_preview=True,
-                            )
-                        logger.info(f"Sent to subscriber {subscriber_id}")
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to send to subscriber {subscriber_id}: {e}"
+                            ),
                         )
-                        failed_subscribers.append(subscriber_id)
+                logger.info(f"Sent to subscriber {subscriber_id}")
 
-                if failed_subscribers:
+            subscriber_ids = list(subscribers)
+            results = await asyncio.gather(
+                *(_send_to_one(s) for s in subscriber_ids),
+                return_exceptions=True,
+            )
+
+            failed_subscribers: list[int] = []
+            for subscriber_id, outcome in zip(subscriber_ids, results, strict=True):
+                if isinstance(outcome, Exception):
                     logger.warning(
-                        f"Failed to reach {len(failed_subscribers)} subscribers"
+                        f"Failed to send to subscriber {subscriber_id}: {outcome}"
                     )
+                    failed_subscribers.append(subscriber_id)
+
+            if failed_subscribers:
+                logger.warning(f"Failed to reach {len(failed_subscribers)} subscribers")
 
-                if is_tts_enabled(self.config):
-                    await self._send_voice_messages(bot, pair, channel_id, subscribers)
+            if is_tts_enabled(self.config):
+                await self._send_voice_messages(
+                    bot, limiter, pair, channel_id, subscribers
+                )
 
             logger.info("Broadcast completed successfully")
 
@@ -266,31 +311,7 @@ class ShulchanAruchYomiBot:
             return
 
         try:
-            unified_msg = "<b>שולחן ערוך יומי</b>\n"
-            unified_msg += f"📅 {date.today().strftime('%d/%m/%Y')}\n\n"
-
-            if pair.first:
-                ref = f"סימן {pair.first.siman}"
-                if pair.first.seif is not None:
-                    ref += f" סעיף {pair.first.seif}"
-                unified_msg += f"<b>א׳</b> {pair.first.volume.volume_he} — {ref}\n"
-                if pair.first.hebrew_text:
-                    preview = pair.first.hebrew_text[:200]
-                    if len(pair.first.hebrew_text) > 200:
-                        preview += "..."
-                    unified_msg += f"{preview}\n\n"
-
-            if pair.second:
-                ref = f"סימן {pair.second.siman}"
-                if pair.second.seif is not None:
-                    ref += f" סעיף {pair.second.seif}"
-                unified_msg += f"<b>ב׳</b> {pair.second.volume.volume_he} — {ref}\n"
-                if pair.second.hebrew_text:
-                    preview = pair.second.hebrew_text[:200]
-                    if len(pair.second.hebrew_text) > 200:
-                        preview += "..."
-                    unified_msg += f"{preview}\n"
-
+            unified_msg = format_unified_message(pair, date.today())
             await publish_text_to_unified_channel(unified_msg)
             logger.info("Published to unified channel successfully")
 
@@ -298,22 +319,52 @@ class ShulchanAruchYomiBot:
             logger.error(f"Failed to publish to unified channel: {e}")
 
     async def _send_voice_messages(
-        self, bot: Bot, pair: DailyPair, channel_id: str, subscribers: set[int]
+        self,
+        bot: Bot,
+        limiter: RateLimiter,
+        pair: DailyPair,
+        channel_id: str,
+        subscribers: frozenset[int],
     ) -> None:
         """Send voice messages to channel and subscribers."""
+        # Generate the audio once; a failure here is logged once, not per chat
+        try:
+            voices = await start_voice_generation(
+                pair, credentials_json=self.config.google_tts_credentials_json
+            )
+        except Exception:
+            logger.exception("Voice generation failed, skipping voice messages")
+            return
+
         try:
-            tts = HebrewTTSClient(self.config.google_tts_credentials_json)
+            await send_voices(bot, channel_id, voices, limiter=limiter)
+        except Exception as e:
+            logger.error(f"Failed to send voice to channel: {e}")
 
-            await send_voice_for_pair(bot, pair, channel_id, _tts_client=tts)
+        semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
 
-            for subscriber_id in subscribers:
-                try:
-                    await send_voice_for_pair(bot, pair, subscriber_id, _tts_client=tts)
-                except Exception as e:
-                    logger.warning(f"Voice to subscriber {subscriber_id} failed: {e}")
+        async def _send_voice_to_one(subscriber_id: int) -> None:
+            async with semaphore:
+                await send_voices(bot, subscriber_id, voices, limiter=limiter)
 
-        except Exception as e:
-            logger.error(f"Voice message delivery failed: {e}")
+        subscriber_ids = list(subscribers)
+        results = await asyncio.gather(
+            *(_send_voice_to_one(s) for s in subscriber_ids),
+            return_exceptions=True,
+        )
+
+        failed_subscribers: list[int] = []
+        for subscriber_id, outcome in zip(subscriber_ids, results, strict=True):
+            if isinstance(outcome, Exception):
+                logger.warning(
+                    f"Failed to send voice to subscriber {subscriber_id}: {outcome}"
+                )
+                failed_subscribers.append(subscriber_id)
+
+        if failed_subscribers:
+            logger.warning(
+                f"Failed to send voice to {len(failed_subscribers)} subscribers"
+            )
 
     def run_polling(self) -> None:
         """Run bot in polling mode with daily scheduling."""
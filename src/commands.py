@@ -14,9 +14,10 @@ import logging
 from datetime import date
 
 from .formatter import (
+    ERROR_MESSAGE,
+    INFO_MESSAGE,
     format_daily_message,
     format_error_message,
-    format_info_message,
     format_welcome_message,
 )
 from .selector import HalachaSelector
@@ -76,9 +77,9 @@ def get_today_messages(
 
 def get_info_message() -> str:
     """Get message for /info command."""
-    return format_info_message()
+    return INFO_MESSAGE
 
 
 def get_error_message() -> str:
     """Get generic error message."""
-    return format_error_message()
+    return ERROR_MESSAGE
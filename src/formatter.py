@@ -1,39 +1,95 @@
 """Message formatting for Telegram."""
 
-from collections.abc import Callable
+import bisect
+import functools
+import re
 from datetime import date
 
 from .models import DailyPair, Halacha
 
 MAX_MESSAGE_LENGTH = 4000
 
-_STATIC_MESSAGES: dict[str, str] = {}
+_HTML_TAG_RE = re.compile(r"<(/?)([a-zA-Z]+)[^>]*>")
+_SPACE_RE = re.compile(" ")
 
+WELCOME_MESSAGE = """<b>📚 שולחן ערוך יומי</b>
 
-def _get_static_message(key: str, generator: Callable[[], str]) -> str:
-    """Get a static message from cache or generate it."""
-    if key not in _STATIC_MESSAGES:
-        _STATIC_MESSAGES[key] = generator()
-    return _STATIC_MESSAGES[key]
+ברוכים הבאים! כל יום שתי הלכות חדשות מהשולחן ערוך.
+🔊 כולל הקראה קולית בעברית — ניתן להאזין ב-1x, 1.5x או 2x.
+
+✅ נרשמת אוטומטית לקבלת הלכות יומיות.
+לביטול הרשמה: /unsubscribe"""
+
+INFO_MESSAGE = """<b>📚 שולחן ערוך יומי</b>
+
+<b>שולחן ערוך</b> הוא ספר ההלכה המרכזי שחיבר רבי יוסף קארו. הספר מחולק לארבעה חלקים: אורח חיים, יורה דעה, אבן העזר, וחושן משפט.
+
+<b>פקודות:</b>
+/today - הלכות היום + הקראה קולית
+/subscribe - הרשמה להלכות יומיות
+/unsubscribe - ביטול הרשמה
+/info - מידע ועזרה
+
+🔊 כל הלכה מלווה בהקראה קולית בעברית. ניתן להאזין ב-1x, 1.5x או 2x.
+
+📚 <a href="https://www.sefaria.org/Shulchan_Arukh">קרא בספריא</a>
+💻 <a href="https://github.com/naorbrown/shulchan-aruch-yomi">קוד פתוח</a>"""
+
+ERROR_MESSAGE = "לא הצלחתי לטעון את ההלכות. נסה שוב בעוד כמה דקות."
 
 
 def split_text(text: str, max_len: int) -> list[str]:
     """Split text into chunks at word boundaries."""
     if len(text) <= max_len:
         return [text]
+    spaces = [m.start() for m in _SPACE_RE.finditer(text)]
     chunks = []
-    while text:
-        if len(text) <= max_len:
-            chunks.append(text)
+    start, end = 0, len(text)
+    while start < end:
+        if end - start <= max_len:
+            chunks.append(text[start:])
             break
-        split_at = text.rfind(" ", 0, max_len)
-        if split_at == -1:
-            split_at = max_len
-        chunks.append(text[:split_at])
-        text = text[split_at:].lstrip()
+        i = bisect.bisect_left(spaces, start + max_len) - 1
+        split_at = spaces[i] if i >= 0 and spaces[i] >= start else start + max_len
+        chunks.append(text[start:split_at])
+        start = split_at
+        while start < end and text[start].isspace():
+            start += 1
     return chunks
 
 
+def _tags_balanced(html: str) -> bool:
+    """Check that every HTML tag opened in a message is also closed in it."""
+    depth = 0
+    for match in _HTML_TAG_RE.finditer(html):
+        depth += -1 if match.group(1) else 1
+        if depth < 0:
+            return False
+    return depth == 0
+
+
+def coalesce_messages(
+    messages: list[str], limit: int = MAX_MESSAGE_LENGTH
+) -> list[str]:
+    """Merge consecutive messages that fit together into a single message.
+
+    Fewer messages means fewer sendMessage calls per recipient. Messages with
+    unbalanced HTML tags are never merged.
+    """
+    coalesced: list[str] = []
+    for msg in messages:
+        if (
+            coalesced
+            and len(coalesced[-1]) + len(msg) + 2 <= limit
+            and _tags_balanced(coalesced[-1])
+            and _tags_balanced(msg)
+        ):
+            coalesced[-1] = f"{coalesced[-1]}\n\n{msg}"
+        else:
+            coalesced.append(msg)
+    return coalesced
+
+
 def format_halacha_messages(
     halacha: Halacha, number: int, date_str: str = ""
 ) -> list[str]:
@@ -64,59 +120,55 @@ def format_halacha_messages(
     return messages
 
 
+@functools.lru_cache(maxsize=32)
+def _format_daily_messages(pair: DailyPair, for_date: date) -> tuple[str, ...]:
+    """Format and memoize the daily messages for a pair and date."""
+    date_str = for_date.strftime("%d/%m/%Y")
+    return (
+        *format_halacha_messages(pair.first, 1, date_str),
+        *format_halacha_messages(pair.second, 2, ""),
+    )
+
+
 def format_daily_message(pair: DailyPair, for_date: date | None = None) -> list[str]:
     """Format daily message as list of messages."""
     if for_date is None:
         for_date = date.today()
-    date_str = for_date.strftime("%d/%m/%Y")
-
-    messages = []
-    messages.extend(format_halacha_messages(pair.first, 1, date_str))
-    messages.extend(format_halacha_messages(pair.second, 2, ""))
-    return messages
+    return list(_format_daily_messages(pair, for_date))
 
 
-def format_welcome_message() -> str:
-    """Get welcome message."""
+def format_unified_message(pair: DailyPair, for_date: date | None = None) -> str:
+    """Format the condensed summary for the unified Torah Yomi channel."""
+    if for_date is None:
+        for_date = date.today()
 
-    def _generate() -> str:
-        return """<b>📚 שולחן ערוך יומי</b>
+    parts = [
+        "<b>שולחן ערוך יומי</b>\n",
+        f"📅 {for_date.strftime('%d/%m/%Y')}\n\n",
+    ]
+    for label, halacha, spacing in (
+        ("א׳", pair.first, "\n\n"),
+        ("ב׳", pair.second, "\n"),
+    ):
+        ref = f"סימן {halacha.siman}"
+        if halacha.seif is not None:
+            ref += f" סעיף {halacha.seif}"
+        parts.append(f"<b>{label}</b> {halacha.volume.volume_he} — {ref}\n")
+        if halacha.preview_he:
+            parts.append(f"{halacha.preview_he}{spacing}")
+    return "".join(parts)
 
-ברוכים הבאים! כל יום שתי הלכות חדשות מהשולחן ערוך.
-🔊 כולל הקראה קולית בעברית — ניתן להאזין ב-1x, 1.5x או 2x.
 
-✅ נרשמת אוטומטית לקבלת הלכות יומיות.
-לביטול הרשמה: /unsubscribe"""
-
-    return _get_static_message("welcome", _generate)
+def format_welcome_message() -> str:
+    """Get welcome message."""
+    return WELCOME_MESSAGE
 
 
 def format_info_message() -> str:
     """Get combined info message."""
-
-    def _generate() -> str:
-        return """<b>📚 שולחן ערוך יומי</b>
-
-<b>שולחן ערוך</b> הוא ספר ההלכה המרכזי שחיבר רבי יוסף קארו. הספר מחולק לארבעה חלקים: אורח חיים, יורה דעה, אבן העזר, וחושן משפט.
-
-<b>פקודות:</b>
-/today - הלכות היום + הקראה קולית
-/subscribe - הרשמה להלכות יומיות
-/unsubscribe - ביטול הרשמה
-/info - מידע ועזרה
-
-🔊 כל הלכה מלווה בהקראה קולית בעברית. ניתן להאזין ב-1x, 1.5x או 2x.
-
-📚 <a href="https://www.sefaria.org/Shulchan_Arukh">קרא בספריא</a>
-💻 <a href="https://github.com/naorbrown/shulchan-aruch-yomi">קוד פתוח</a>"""
-
-    return _get_static_message("info", _generate)
+    return INFO_MESSAGE
 
 
 def format_error_message() -> str:
     """Get error message."""
-
-    def _generate() -> str:
-        return "לא הצלחתי לטעון את ההלכות. נסה שוב בעוד כמה דקות."
-
-    return _get_static_message("error", _generate)
+    return ERROR_MESSAGE
@@ -1,9 +1,29 @@
 """Data models for Shulchan Aruch Yomi."""
 
-from dataclasses import dataclass
+import unicodedata
+from dataclasses import dataclass, field
 
+PREVIEW_LENGTH = 200
 
-@dataclass(frozen=True)
+
+def _make_preview(text: str, limit: int = PREVIEW_LENGTH) -> str:
+    """Truncate text for a preview without splitting words or niqqud.
+
+    Never cuts between a letter and its combining marks, and prefers to
+    break at the last space before the limit.
+    """
+    if len(text) <= limit:
+        return text
+    cut = limit
+    while cut > 0 and unicodedata.combining(text[cut]):
+        cut -= 1
+    space = text.rfind(" ", 0, cut)
+    if space > 0:
+        cut = space
+    return f"{text[:cut].rstrip()}..."
+
+
+@dataclass(frozen=True, slots=True)
 class Volume:
     """A volume of the Shulchan Aruch."""
 
@@ -13,7 +33,7 @@ class Volume:
     max_siman: int  # Highest siman number in this volume
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Halacha:
     """A full siman (chapter) from the Shulchan Aruch."""
 
@@ -22,6 +42,19 @@ class Halacha:
     seif: int | None  # None = full siman, int = specific seif
     hebrew_text: str
     sefaria_url: str
+    preview_he: str = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the short Hebrew preview and the hash."""
+        object.__setattr__(self, "preview_he", _make_preview(self.hebrew_text))
+        object.__setattr__(
+            self, "_hash", hash((self.volume.volume, self.siman, self.seif))
+        )
+
+    def __hash__(self) -> int:
+        """Return the hash computed at construction."""
+        return self._hash
 
     @property
     def reference(self) -> str:
@@ -39,7 +72,7 @@ class Halacha:
         return base
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyPair:
     """A pair of halachot for the day from two different volumes."""
 
@@ -0,0 +1,160 @@
+"""Minimal Ogg Opus remuxing, used to join TTS audio without re-encoding."""
+
+import struct
+import zlib
+
+# capture pattern, version, header type, granule position, serial number,
+# page sequence number, CRC, segment count (RFC 3533)
+_PAGE_HEADER = struct.Struct("<4sBBqIIIB")
+_CRC_OFFSET = 22
+
+BOS = 0x02
+EOS = 0x04
+
+# Pages are closed once they reach either limit
+MAX_PAGE_SEGMENTS = 255
+TARGET_PAGE_BYTES = 4096
+
+
+# Ogg's CRC-32 is the unreflected form of zlib's (same polynomial, zero
+# init, no final xor). Feeding zlib bit-reversed bytes with the register
+# preset to zero and reversing the result gives the Ogg checksum, with both
+# passes running in C.
+_REVERSE_BITS = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
+
+
+def _crc32(data: bytes | bytearray) -> int:
+    """Ogg page checksum: unreflected CRC-32, zero init, no final xor."""
+    crc = zlib.crc32(data.translate(_REVERSE_BITS), 0xFFFFFFFF) ^ 0xFFFFFFFF
+    return int(f"{crc:032b}"[::-1], 2)
+
+
+def _lacing(packet: bytes) -> bytes:
+    """Segment table entries for one packet."""
+    full, rest = divmod(len(packet), 255)
+    return b"\xff" * full + bytes((rest,))
+
+
+def _page(
+    packets: list[bytes], granule: int, serial: int, seqno: int, flags: int = 0
+) -> bytes:
+    """Build one Ogg page holding whole packets."""
+    lacing = b"".join(_lacing(p) for p in packets)
+    page = bytearray(
+        _PAGE_HEADER.pack(b"OggS", 0, flags, granule, serial, seqno, 0, len(lacing))
+    )
+    page += lacing
+    for packet in packets:
+        page += packet
+    struct.pack_into("<I", page, _CRC_OFFSET, _crc32(page))
+    return bytes(page)
+
+
+def read_serial(data: bytes) -> int:
+    """Serial number of the first logical stream in an Ogg file."""
+    serial: int = _PAGE_HEADER.unpack_from(data)[4]
+    return serial
+
+
+def read_stream(data: bytes) -> tuple[list[bytes], int]:
+    """Split a single-stream Ogg file into its packets and final granule."""
+    packets: list[bytes] = []
+    partial = bytearray()
+    granule = 0
+    pos = 0
+    while pos < len(data):
+        capture, _, _, page_granule, *_, segments = _PAGE_HEADER.unpack_from(data, pos)
+        if capture != b"OggS":
+            raise ValueError(f"Bad Ogg page at offset {pos}")
+        if page_granule != -1:
+            granule = page_granule
+        pos += _PAGE_HEADER.size
+        lacing = data[pos : pos + segments]
+        pos += segments
+        for size in lacing:
+            partial += data[pos : pos + size]
+            pos += size
+            if size < 255:
+                packets.append(bytes(partial))
+                partial.clear()
+    return packets, granule
+
+
+def read_packets(data: bytes) -> list[bytes]:
+    """Split a single-stream Ogg file into its packets."""
+    return read_stream(data)[0]
+
+
+def opus_packet_samples(packet: bytes) -> int:
+    """Number of 48 kHz samples an Opus packet decodes to (RFC 6716, 3.1)."""
+    if not packet:
+        return 0
+    toc = packet[0]
+    config = toc >> 3
+    if config < 12:  # SILK: 10, 20, 40, 60 ms
+        frame = (480, 960, 1920, 2880)[config & 3]
+    elif config < 16:  # Hybrid: 10, 20 ms
+        frame = (480, 960)[config & 1]
+    else:  # CELT: 2.5, 5, 10, 20 ms
+        frame = (120, 240, 480, 960)[config & 3]
+    code = toc & 3
+    if code == 0:
+        return frame
+    if code < 3:
+        return frame * 2
+    return frame * (packet[1] & 0x3F)
+
+
+def concatenate_opus(streams: list[bytes], gap: list[bytes] | None = None) -> bytes:
+    """Join Ogg Opus files into one logical stream, without re-encoding.
+
+    Header packets come from the first file; audio packets from every file
+    are repaged back to back, with the ``gap`` packets between files.
+    Granule positions are recomputed from the packets' own durations, so
+    the result plays and seeks as a single recording. The last file's end
+    trim is carried over to the final granule.
+
+    Only the first file's pre-skip is honoured. Later files keep their
+    encoder priming (pre-skip samples, 6.5 ms for libopus) and end padding,
+    and their first packets are decoded with the state left by the gap.
+    Both land next to the silence gap, so they play as part of the pause.
+    """
+    parsed = [read_stream(stream) for stream in streams]
+    first = parsed[0][0]
+    if len(first) < 2 or not first[0].startswith(b"OpusHead"):
+        raise ValueError("Not an Ogg Opus stream")
+    head, tags = first[0], first[1]
+
+    audio = first[2:]
+    for packets, _ in parsed[1:]:
+        audio.extend(gap or ())
+        audio.extend(packets[2:])
+
+    # Samples the last file's encoder padded past its real end
+    last_packets, last_granule = parsed[-1]
+    end_trim = max(0, sum(map(opus_packet_samples, last_packets[2:])) - last_granule)
+
+    serial = read_serial(streams[0])
+    pages = [
+        _page([head], 0, serial, 0, BOS),
+        _page([tags], 0, serial, 1, 0 if audio else EOS),
+    ]
+
+    granule = 0
+    batch: list[bytes] = []
+    segments = size = 0
+    for packet in audio:
+        needed = len(packet) // 255 + 1
+        if batch and (
+            segments + needed > MAX_PAGE_SEGMENTS or size >= TARGET_PAGE_BYTES
+        ):
+            pages.append(_page(batch, granule, serial, len(pages)))
+            batch, segments, size = [], 0, 0
+        batch.append(packet)
+        granule += opus_packet_samples(packet)
+        segments += needed
+        size += len(packet)
+    if batch:
+        pages.append(_page(batch, granule - end_trim, serial, len(pages), EOS))
+
+    return b"".join(pages)
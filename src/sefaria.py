@@ -1,11 +1,13 @@
 """Sefaria API client for fetching Shulchan Aruch texts."""
 
-import json
+import functools
 import logging
-import random
 import re
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import orjson
 import requests
 
 from .config import get_data_dir
@@ -15,6 +17,45 @@ logger = logging.getLogger(__name__)
 
 VOLUME_NAMES = ["Orach Chaim", "Yoreh De'ah", "Even HaEzer", "Choshen Mishpat"]
 
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _clean_html(text: str) -> str:
+    """Strip HTML tags and collapse whitespace.
+
+    Skips the regex entirely for tag-free text, and collapses whitespace
+    with str.split(), which treats the same characters as whitespace as the
+    regex engine does but runs as a single C-level pass.
+    """
+    if "<" in text:
+        text = _TAG_RE.sub("", text)
+    return " ".join(text.split())
+
+
+# Simanim tried per volume before giving up, and how many retries run at once
+MAX_ATTEMPTS = 10
+PARALLEL_FETCHES = 5
+
+
+@functools.cache
+def _load_catalog() -> tuple[Volume, ...]:
+    """Load the volume catalog from data/volumes.json, once per process."""
+    catalog_path = get_data_dir() / "volumes.json"
+    try:
+        data = orjson.loads(catalog_path.read_bytes())
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Volume catalog not found at {catalog_path}") from None
+
+    return tuple(
+        Volume(
+            volume=item["volume"],
+            volume_he=item["volume_he"],
+            ref_base=item["ref_base"],
+            max_siman=item["max_siman"],
+        )
+        for item in data
+    )
+
 
 class SefariaClient:
     """Client for the Sefaria API."""
@@ -22,55 +63,56 @@ class SefariaClient:
     BASE_URL = "https://www.sefaria.org/api"
     WEB_URL = "https://www.sefaria.org"
 
+    # Process-wide session so every client reuses the same keep-alive pool
+    _shared_session: requests.Session | None = None
+
     def __init__(self, timeout: int = 10):
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "ShulchanAruchYomiBot/1.0",
-                "Connection": "keep-alive",
-            }
-        )
-        adapter = requests.adapters.HTTPAdapter(
-            pool_connections=10,
-            pool_maxsize=10,
-            max_retries=1,
-        )
-        self.session.mount("https://", adapter)
+        self.session = self.shared_session()
         self._catalog: list[Volume] | None = None
+        self._by_name: dict[str, Volume] = {}
+
+    @classmethod
+    def shared_session(cls) -> requests.Session:
+        """Get the process-wide HTTP session, creating it on first use."""
+        if cls._shared_session is None:
+            session = requests.Session()
+            session.headers.update(
+                {
+                    "User-Agent": "ShulchanAruchYomiBot/1.0",
+                    "Connection": "keep-alive",
+                }
+            )
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=10,
+                # Room for PARALLEL_FETCHES candidate fetches from several
+                # concurrent searches without discarding pooled connections
+                pool_maxsize=20,
+                max_retries=1,
+            )
+            session.mount("https://", adapter)
+            cls._shared_session = session
+        return cls._shared_session
+
+    @classmethod
+    def close_shared_session(cls) -> None:
+        """Close the process-wide HTTP session and its pooled connections."""
+        if cls._shared_session is not None:
+            cls._shared_session.close()
+            cls._shared_session = None
 
     @property
     def catalog(self) -> list[Volume]:
         """Load and cache the volume catalog."""
         if self._catalog is None:
-            self._catalog = self._load_catalog()
+            self._catalog = list(_load_catalog())
         return self._catalog
 
-    def _load_catalog(self) -> list[Volume]:
-        """Load the volume catalog from data/volumes.json."""
-        catalog_path = get_data_dir() / "volumes.json"
-        if not catalog_path.exists():
-            raise FileNotFoundError(f"Volume catalog not found at {catalog_path}")
-
-        with open(catalog_path, encoding="utf-8") as f:
-            data = json.load(f)
-
-        return [
-            Volume(
-                volume=item["volume"],
-                volume_he=item["volume_he"],
-                ref_base=item["ref_base"],
-                max_siman=item["max_siman"],
-            )
-            for item in data
-        ]
-
     def get_volume(self, name: str) -> Volume | None:
         """Get a volume by English name."""
-        for v in self.catalog:
-            if v.volume == name:
-                return v
-        return None
+        if not self._by_name:
+            self._by_name = {v.volume: v for v in self.catalog}
+        return self._by_name.get(name)
 
     def get_text(self, reference: str) -> dict[str, Any] | None:
         """Fetch text from Sefaria API."""
@@ -78,9 +120,9 @@ class SefariaClient:
         try:
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
-            result: dict[str, Any] = response.json()
+            result: dict[str, Any] = orjson.loads(response.content)
             return result
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Failed to fetch {reference}: {e}")
             return None
 
@@ -97,8 +139,7 @@ class SefariaClient:
         if isinstance(hebrew_raw, str):
             hebrew_raw = [hebrew_raw]
 
-        cleaned_seifim = [self._clean_text(s) for s in hebrew_raw if s]
-        cleaned_seifim = [s for s in cleaned_seifim if s]
+        cleaned_seifim = [c for s in hebrew_raw if s and (c := _clean_html(s))]
 
         if not cleaned_seifim:
             logger.warning(f"No Hebrew text for {reference}")
@@ -124,29 +165,42 @@ class SefariaClient:
         """Clean HTML and normalize text."""
         if not text:
             return ""
-        text = re.sub(r"<[^>]+>", "", text)
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
+        return _clean_html(text)
 
     def get_random_halacha_from_volume(
-        self, volume: Volume, rng: random.Random
+        self, volume: Volume, candidates: Sequence[int]
     ) -> Halacha | None:
         """Get a random full siman from a specific volume.
 
-        Uses the provided RNG for deterministic selection.
-        Strategy: pick random siman, fetch all seifim.
+        The caller draws the candidate simanim for deterministic selection.
+        Strategy: fetch all seifim of the first candidate. If it misses, the
+        remaining candidates are fetched concurrently and the earliest valid
+        one wins, so the result matches a sequential search. Repeated
+        candidates are fetched only once.
         """
-        for attempt in range(10):
-            siman = rng.randint(1, volume.max_siman)
+        candidates = list(dict.fromkeys(candidates))
+        if not candidates:
+            return None
 
-            halacha = self.fetch_full_siman(volume, siman)
-            if halacha:
-                logger.info(
-                    f"Found halacha: {halacha.reference} (attempt {attempt + 1})"
-                )
-                return halacha
+        halacha = self.fetch_full_siman(volume, candidates[0])
+        if halacha:
+            logger.info(f"Found halacha: {halacha.reference} (attempt 1)")
+            return halacha
+
+        with ThreadPoolExecutor(max_workers=PARALLEL_FETCHES) as executor:
+            results = executor.map(
+                lambda siman: self.fetch_full_siman(volume, siman), candidates[1:]
+            )
+            for attempt, halacha in enumerate(results, 2):
+                if halacha:
+                    logger.info(
+                        f"Found halacha: {halacha.reference} (attempt {attempt})"
+                    )
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    return halacha
 
         logger.error(
-            f"Failed to find valid halacha in {volume.volume} after 10 attempts"
+            f"Failed to find valid halacha in {volume.volume} "
+            f"after {len(candidates)} attempts"
         )
         return None
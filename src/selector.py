@@ -1,27 +1,95 @@
 """Daily halacha selection logic."""
 
+import asyncio
+import functools
 import hashlib
-import json
 import logging
 import random
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
+from typing import Any, TypeVar
+
+import orjson
 
 from .config import get_data_dir
 from .formatter import format_daily_message, format_welcome_message
 from .models import DailyPair, Halacha, Volume
-from .sefaria import VOLUME_NAMES, SefariaClient
+from .sefaria import MAX_ATTEMPTS, VOLUME_NAMES, SefariaClient
 
 logger = logging.getLogger(__name__)
 
 CACHE_DIR = get_data_dir() / "cache"
 
+# Dates kept in memory; older entries are evicted and reloaded from disk
+MEMORY_CACHE_SIZE = 64
+
+_V = TypeVar("_V")
+
+
+class _LRUCache(OrderedDict[str, _V]):
+    """Dict that evicts its least recently used entries beyond maxsize."""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key: str) -> _V:
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: str, value: _V) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
 # In-memory cache for daily pairs (avoids repeated file I/O)
-_memory_cache: dict[str, DailyPair] = {}
+_memory_cache: _LRUCache[DailyPair] = _LRUCache(MEMORY_CACHE_SIZE)
 
 # In-memory cache for pre-formatted messages (instant responses)
-_message_cache: dict[str, list[str]] = {}
+_message_cache: _LRUCache[list[str]] = _LRUCache(MEMORY_CACHE_SIZE)
+
+
+# Pair cache files are written behind the request path by a single thread,
+# so writes land in submission order and never race each other.
+_cache_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pair-cache")
+
+
+def _write_cache_file(cache_path: Path, payload: bytes) -> None:
+    """Write a serialized pair to its cache file."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(payload)
+    except OSError as e:
+        logger.warning(f"Failed to write cache {cache_path.name}: {e}")
+        return
+    logger.info(f"Cached pair and formatted messages in {cache_path.name}")
+
+
+@functools.lru_cache(maxsize=64)
+def _daily_seed(seed: str) -> int:
+    """Derive the day's volume-selection RNG seed from a BLAKE2b digest."""
+    digest = hashlib.blake2b(seed.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _candidate_simanim(seed: str, volume: Volume) -> list[int]:
+    """Draw the day's candidate simanim for a volume.
+
+    Each 4-byte slice of one BLAKE2b digest is a deterministic draw, so no
+    RNG state has to be set up per volume.
+    """
+    digest = hashlib.blake2b(
+        f"{seed}-{volume.volume}".encode(), digest_size=4 * MAX_ATTEMPTS
+    ).digest()
+    return [
+        int.from_bytes(digest[i : i + 4], "big") % volume.max_siman + 1
+        for i in range(0, len(digest), 4)
+    ]
 
 
 class HalachaSelector:
@@ -29,6 +97,7 @@ class HalachaSelector:
 
     def __init__(self, client: SefariaClient):
         self.client = client
+        self._inflight: dict[date, asyncio.Future[DailyPair | None]] = {}
 
     def _get_daily_seed(self, for_date: date) -> str:
         """Generate a deterministic seed for a given date."""
@@ -36,9 +105,7 @@ class HalachaSelector:
 
     def _get_daily_rng(self, for_date: date) -> random.Random:
         """Get a seeded RNG for deterministic daily selection."""
-        seed = self._get_daily_seed(for_date)
-        seed_int = int(hashlib.sha256(seed.encode()).hexdigest()[:16], 16)
-        return random.Random(seed_int)
+        return random.Random(_daily_seed(self._get_daily_seed(for_date)))
 
     def _select_two_volumes(self, rng: random.Random) -> tuple[Volume, Volume]:
         """Select two different volumes for the day."""
@@ -54,6 +121,10 @@ class HalachaSelector:
         """Get the cache file path for a date."""
         return CACHE_DIR / f"pair_{for_date.isoformat()}.json"
 
+    def _cached_volume(self, data: dict[str, Any]) -> Volume:
+        """Resolve a cached volume to the shared catalog instance."""
+        return self.client.get_volume(data["volume"]) or Volume(**data)
+
     def _load_cached_pair(self, for_date: date) -> DailyPair | None:
         """Load cached daily pair if available."""
         cache_key = for_date.isoformat()
@@ -62,15 +133,15 @@ class HalachaSelector:
             logger.debug(f"Memory cache hit for {for_date}")
             return _memory_cache[cache_key]
 
-        cache_path = self._get_cache_path(for_date)
-        if not cache_path.exists():
+        try:
+            raw = self._get_cache_path(for_date).read_bytes()
+        except FileNotFoundError:
             return None
 
         try:
-            with open(cache_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = orjson.loads(raw)
 
-            first_vol = Volume(**data["first"]["volume"])
+            first_vol = self._cached_volume(data["first"]["volume"])
             first = Halacha(
                 volume=first_vol,
                 siman=data["first"]["siman"],
@@ -79,7 +150,7 @@ class HalachaSelector:
                 sefaria_url=data["first"]["sefaria_url"],
             )
 
-            second_vol = Volume(**data["second"]["volume"])
+            second_vol = self._cached_volume(data["second"]["volume"])
             second = Halacha(
                 volume=second_vol,
                 siman=data["second"]["siman"],
@@ -95,27 +166,33 @@ class HalachaSelector:
                 _message_cache[cache_key] = data["formatted_messages"]
                 logger.debug(f"Loaded cached formatted messages for {for_date}")
             else:
-                welcome = format_welcome_message()
-                content_messages = format_daily_message(pair, for_date)
-                _message_cache[cache_key] = [welcome] + content_messages
+                self._ensure_messages(pair, for_date)
 
             logger.info(f"Loaded cached pair for {for_date}")
             return pair
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (orjson.JSONDecodeError, KeyError, TypeError) as e:
             logger.warning(f"Failed to load cache for {for_date}: {e}")
             return None
 
-    def _save_cached_pair(self, pair: DailyPair, for_date: date) -> None:
-        """Save daily pair and pre-formatted messages to cache."""
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    def _ensure_messages(self, pair: DailyPair, for_date: date) -> list[str]:
+        """Get the formatted messages for a pair, formatting them only once."""
+        cache_key = for_date.isoformat()
+        if cache_key not in _message_cache:
+            _message_cache[cache_key] = [
+                format_welcome_message(),
+                *format_daily_message(pair, for_date),
+            ]
+        return _message_cache[cache_key]
+
+    def _save_cached_pair(self, pair: DailyPair, for_date: date) -> Future[None]:
+        """Save daily pair and pre-formatted messages to cache.
+
+        The messages are cached in memory right away; the file is written
+        behind the caller on the cache writer thread.
+        """
         cache_path = self._get_cache_path(for_date)
 
-        welcome = format_welcome_message()
-        content_messages = format_daily_message(pair, for_date)
-        formatted_messages = [welcome] + content_messages
-
-        cache_key = for_date.isoformat()
-        _message_cache[cache_key] = formatted_messages
+        formatted_messages = self._ensure_messages(pair, for_date)
 
         data = {
             "date_seed": pair.date_seed,
@@ -146,9 +223,8 @@ class HalachaSelector:
             },
         }
 
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        logger.info(f"Cached pair and formatted messages for {for_date}")
+        payload = orjson.dumps(data)
+        return _cache_writer.submit(_write_cache_file, cache_path, payload)
 
     def _get_fallback_halacha(self, volume: Volume, rng: random.Random) -> Halacha:
         """Create a fallback halacha when API fails."""
@@ -179,28 +255,21 @@ class HalachaSelector:
 
         logger.info(f"Selecting halachot for {for_date}: {vol1.volume} + {vol2.volume}")
 
-        rng1 = random.Random(
-            int(
-                hashlib.sha256(f"{for_date.isoformat()}-1".encode()).hexdigest()[:16],
-                16,
-            )
-        )
-        rng2 = random.Random(
-            int(
-                hashlib.sha256(f"{for_date.isoformat()}-2".encode()).hexdigest()[:16],
-                16,
-            )
-        )
+        seed = self._get_daily_seed(for_date)
 
         first: Halacha | None = None
         second: Halacha | None = None
 
         with ThreadPoolExecutor(max_workers=2) as executor:
             future1 = executor.submit(
-                self.client.get_random_halacha_from_volume, vol1, rng1
+                self.client.get_random_halacha_from_volume,
+                vol1,
+                _candidate_simanim(seed, vol1),
             )
             future2 = executor.submit(
-                self.client.get_random_halacha_from_volume, vol2, rng2
+                self.client.get_random_halacha_from_volume,
+                vol2,
+                _candidate_simanim(seed, vol2),
             )
             first = future1.result()
             second = future2.result()
@@ -215,7 +284,7 @@ class HalachaSelector:
         pair = DailyPair(
             first=first,
             second=second,
-            date_seed=self._get_daily_seed(for_date),
+            date_seed=seed,
         )
 
         fallback_marker = "לא ניתן לטעון"
@@ -224,11 +293,36 @@ class HalachaSelector:
             and fallback_marker not in second.hebrew_text
         ):
             self._save_cached_pair(pair, for_date)
+        else:
+            self._ensure_messages(pair, for_date)
 
         _memory_cache[for_date.isoformat()] = pair
 
         return pair
 
+    async def aget_daily_pair(self, for_date: date | None = None) -> DailyPair | None:
+        """Async variant of get_daily_pair for use on the event loop.
+
+        Runs the blocking lookup in a worker thread. Concurrent callers for
+        the same date share a single in-flight lookup.
+        """
+        if for_date is None:
+            for_date = date.today()
+
+        cached = _memory_cache.get(for_date.isoformat())
+        if cached:
+            return cached
+
+        future = self._inflight.get(for_date)
+        if future is None:
+            future = asyncio.ensure_future(
+                asyncio.to_thread(self.get_daily_pair, for_date)
+            )
+            self._inflight[for_date] = future
+            future.add_done_callback(lambda _: self._inflight.pop(for_date, None))
+
+        return await asyncio.shield(future)
+
     def get_cached_messages(self, for_date: date | None = None) -> list[str] | None:
         """Get pre-formatted messages for a date if cached."""
         if for_date is None:
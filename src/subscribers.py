@@ -1,43 +1,141 @@
 """Subscriber management for individual broadcasts."""
 
-import json
 import logging
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 STATE_DIR = Path(__file__).parent.parent / ".github" / "state"
 SUBSCRIBERS_FILE = STATE_DIR / "subscribers.json"
 
+# Last parsed subscriber set, keyed by the file's identity (path, inode,
+# mtime, size) so an unchanged file is never re-read or re-parsed
+_cache: tuple[tuple[str, int, int, int], frozenset[int]] | None = None
+
+# Inside batch_updates(): True while batching, and the unsaved subscriber
+# set if anything changed
+_batching = False
+_pending: frozenset[int] | None = None
+
+
+def _file_key() -> tuple[str, int, int, int] | None:
+    """Identify the current subscribers file version, or None if missing."""
+    try:
+        st = SUBSCRIBERS_FILE.stat()
+    except FileNotFoundError:
+        return None
+    return (str(SUBSCRIBERS_FILE), st.st_ino, st.st_mtime_ns, st.st_size)
 
-def load_subscribers() -> set[int]:
+
+def load_subscribers() -> frozenset[int]:
     """Load subscriber chat IDs from state file."""
-    if SUBSCRIBERS_FILE.exists():
-        try:
-            data = json.loads(SUBSCRIBERS_FILE.read_text())
-            return set(data.get("subscribers", []))
-        except (json.JSONDecodeError, KeyError, TypeError):
-            logger.warning("Failed to load subscribers, starting fresh")
-            return set()
-    return set()
-
-
-def save_subscribers(subscribers: set[int]) -> None:
-    """Save subscriber chat IDs to state file."""
-    STATE_DIR.mkdir(parents=True, exist_ok=True)
-    SUBSCRIBERS_FILE.write_text(
-        json.dumps({"subscribers": sorted(subscribers)}, indent=2)
+    global _cache
+
+    if _pending is not None:
+        return _pending
+
+    key = _file_key()
+    if key is None:
+        return frozenset()
+    if _cache is not None and _cache[0] == key:
+        return _cache[1]
+
+    try:
+        data = orjson.loads(SUBSCRIBERS_FILE.read_bytes())
+        subscribers = frozenset(data.get("subscribers", []))
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        logger.warning("Failed to load subscribers, starting fresh")
+        subscribers = frozenset()
+
+    _cache = (key, subscribers)
+    return subscribers
+
+
+def _make_temp_file() -> tuple[int, str]:
+    """Create the temp file a save is written to before the rename."""
+    return tempfile.mkstemp(dir=STATE_DIR, prefix=".subscribers_", suffix=".json.tmp")
+
+
+def save_subscribers(subscribers: set[int] | frozenset[int]) -> None:
+    """Save subscriber chat IDs to state file.
+
+    Writes a temp file and renames it into place, so a crash never leaves a
+    half-written file behind.
+    """
+    global _cache
+
+    payload = orjson.dumps(
+        {"subscribers": sorted(subscribers)},
+        option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
     )
+    try:
+        fd, tmp_path = _make_temp_file()
+    except FileNotFoundError:
+        # Only the very first save needs to create the state directory
+        STATE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = _make_temp_file()
+    try:
+        # One write straight to the descriptor; no buffered file object
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, SUBSCRIBERS_FILE)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    key = _file_key()
+    _cache = (key, frozenset(subscribers)) if key is not None else None
     logger.info(f"Saved {len(subscribers)} subscribers")
 
 
+@contextmanager
+def batch_updates() -> Iterator[None]:
+    """Defer subscriber file writes until the block exits.
+
+    add_subscriber() and remove_subscriber() inside the block only update
+    the in-memory set; the file is written once at the end, if anything
+    changed. Nested blocks join the outermost one.
+    """
+    global _batching, _pending
+
+    if _batching:
+        yield
+        return
+
+    _batching = True
+    try:
+        yield
+    finally:
+        pending, _pending, _batching = _pending, None, False
+        if pending is not None:
+            save_subscribers(pending)
+
+
+def _store(subscribers: frozenset[int]) -> None:
+    """Save the subscriber set now, or hold it for the current batch."""
+    global _pending
+
+    if _batching:
+        _pending = subscribers
+    else:
+        save_subscribers(subscribers)
+
+
 def add_subscriber(chat_id: int) -> bool:
     """Add a subscriber. Returns True if newly added."""
     subscribers = load_subscribers()
     if chat_id in subscribers:
         return False
-    subscribers.add(chat_id)
-    save_subscribers(subscribers)
+    _store(subscribers | {chat_id})
     logger.info(f"Added subscriber: {chat_id}")
     return True
 
@@ -47,8 +145,7 @@ def remove_subscriber(chat_id: int) -> bool:
     subscribers = load_subscribers()
     if chat_id not in subscribers:
         return False
-    subscribers.discard(chat_id)
-    save_subscribers(subscribers)
+    _store(subscribers - {chat_id})
     logger.info(f"Removed subscriber: {chat_id}")
     return True
 
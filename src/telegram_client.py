@@ -0,0 +1,102 @@
+"""Shared Telegram Bot instances for the process."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import TypeVar
+
+from telegram import Bot
+from telegram.error import RetryAfter
+from telegram.request import HTTPXRequest
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Attempts per paced send before a flood-control error is given up on
+MAX_SEND_ATTEMPTS = 3
+
+# Process-wide Bot instances keyed by token (see get_bot)
+_bots: dict[str, Bot] = {}
+
+
+async def get_bot(token: str) -> Bot:
+    """Get an initialized Bot for a token, shared for the process lifetime.
+
+    Reusing one Bot keeps its HTTP connection pool warm across broadcasts
+    and polled commands instead of reconnecting for each one.
+    """
+    bot = _bots.get(token)
+    if bot is None:
+        bot = Bot(
+            token=token,
+            request=HTTPXRequest(
+                # Enough connections for the broadcast's parallel sends
+                connection_pool_size=32,
+                connect_timeout=5.0,
+                read_timeout=20.0,
+                pool_timeout=10.0,
+                http_version="1.1",
+            ),
+        )
+        _bots[token] = bot
+    await bot.initialize()
+    return bot
+
+
+async def shutdown_bots() -> None:
+    """Shut down the shared Bots, closing their connection pools."""
+    while _bots:
+        _, bot = _bots.popitem()
+        await bot.shutdown()
+
+
+def retry_after_seconds(error: RetryAfter) -> float:
+    """Seconds Telegram asked us to wait before sending again."""
+    retry_after = error.retry_after
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    return float(retry_after)
+
+
+class RateLimiter:
+    """Spaces calls out so at most ``rate`` start per second.
+
+    One limiter is shared by every send of a broadcast, and a flood-control
+    wait from Telegram holds all of them back, not just the one that hit it.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        """Sleep until this caller's slot comes up."""
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every call that has not started for ``seconds``."""
+        resume = asyncio.get_running_loop().time() + seconds
+        self._next_slot = max(self._next_slot, resume)
+
+
+async def send_paced(limiter: RateLimiter, send: Callable[[], Awaitable[_T]]) -> _T:
+    """Make a Telegram call at the limiter's pace, retrying on flood control."""
+    for attempt in range(1, MAX_SEND_ATTEMPTS):
+        await limiter.wait()
+        try:
+            return await send()
+        except RetryAfter as e:
+            delay = retry_after_seconds(e)
+            logger.warning(
+                f"Flood control (attempt {attempt}/{MAX_SEND_ATTEMPTS}), "
+                f"retrying in {delay:.0f}s"
+            )
+            limiter.pause(delay)
+    await limiter.wait()
+    return await send()
@@ -2,31 +2,44 @@
 
 from __future__ import annotations
 
-import io
+import asyncio
+import bisect
+import functools
+import hashlib
+import itertools
 import logging
 import os
 import re
 import tempfile
-from datetime import date
-from typing import TYPE_CHECKING
-
-from google.cloud import texttospeech
-from pydub import AudioSegment
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeGuard
 
 from .config import get_data_dir
 from .models import DailyPair
+from .ogg import concatenate_opus
 
 if TYPE_CHECKING:
     from .config import Config
+    from .selector import HalachaSelector
+    from .telegram_client import RateLimiter
 
 logger = logging.getLogger(__name__)
 
 # Audio cache directory
 AUDIO_CACHE_DIR = get_data_dir() / "cache" / "audio"
 
-# Google Cloud TTS byte limit is 5000 per request.
-# Nikud'd Hebrew is ~4 bytes/char, so ~1200 chars stays safely under the limit.
-MAX_CHUNK_CHARS = 1200
+# Google Cloud TTS accepts at most 5000 bytes of input per request; chunks
+# are budgeted in UTF-8 bytes with a small margin under that limit.
+MAX_CHUNK_BYTES = 4800
+
+# Chunks synthesized concurrently per text, kept low to respect API quotas
+MAX_PARALLEL_CHUNKS = 4
+
+# Sentence boundary: whitespace after a period, colon or sof pasuq
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.:׃])\s+")
 
 # Voice selection
 VOICE_NAME = "he-IL-Wavenet-D"
@@ -38,18 +51,62 @@ SPEAKING_RATE = 1.0
 # Silence between chunks (milliseconds)
 INTER_CHUNK_SILENCE_MS = 300
 
+# A 20 ms Opus silence frame (CELT fullband, mono), repeated to fill the gap
+_SILENCE_PACKET = b"\xf8\xff\xfe"
+_SILENCE_PACKETS = [_SILENCE_PACKET] * (INTER_CHUNK_SILENCE_MS // 20)
+
 
-def is_tts_enabled(config: Config | None) -> bool:
+def is_tts_enabled(config: Config | None) -> TypeGuard[Config]:
     """Check whether TTS voice messages should be sent."""
     if config is None:
         return False
     return config.google_tts_enabled
 
 
+@functools.lru_cache(maxsize=8)
+def _read_cached_audio(path: Path, mtime_ns: int) -> bytes:
+    """Read a cached audio file, keeping recent ones in memory.
+
+    Keyed by mtime so a rewritten file is read again; repeat hits while
+    broadcasting one pair to many chats are served from RAM.
+    """
+    return path.read_bytes()
+
+
+def _write_cached_audio(path: Path, audio: bytes) -> None:
+    """Write an audio file to the cache atomically.
+
+    Written to a temp file and renamed into place, so a concurrent reader
+    never sees a half-written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".audio_", suffix=".tmp")
+    try:
+        try:
+            os.write(fd, audio)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        _remove_file(tmp_path)
+        raise
+
+
+def _remove_file(path: str) -> None:
+    """Delete a file if it still exists."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
 class HebrewTTSClient:
     """Client for generating Hebrew audio using Google Cloud TTS."""
 
     def __init__(self, credentials_json: str | None = None):
+        # Imported here so importing this module stays cheap when TTS is off
+        from google.cloud import texttospeech
+
         self._temp_creds_path: str | None = None
 
         if credentials_json:
@@ -58,6 +115,8 @@ class HebrewTTSClient:
             os.close(fd)
             self._temp_creds_path = path
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = path
+            # Removes the file when the client is collected or at exit
+            weakref.finalize(self, _remove_file, path)
 
         self.client = texttospeech.TextToSpeechClient()
         self.voice = texttospeech.VoiceSelectionParams(
@@ -69,22 +128,20 @@ class HebrewTTSClient:
             speaking_rate=SPEAKING_RATE,
         )
 
-    def __del__(self) -> None:
-        """Clean up temp credentials file."""
-        if self._temp_creds_path and os.path.exists(self._temp_creds_path):
-            os.unlink(self._temp_creds_path)
-
     def get_or_generate_audio(self, text: str, cache_key: str) -> bytes | None:
         """Get audio from cache or generate it."""
         cache_path = AUDIO_CACHE_DIR / f"{cache_key}.ogg"
-        if cache_path.exists():
+        try:
+            cached = _read_cached_audio(cache_path, cache_path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            pass
+        else:
             logger.info(f"Audio cache hit: {cache_key}")
-            return cache_path.read_bytes()
+            return cached
 
         audio = self.synthesize_text(text)
         if audio:
-            AUDIO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-            cache_path.write_bytes(audio)
+            _write_cached_audio(cache_path, audio)
             logger.info(f"Cached audio: {cache_key} ({len(audio)} bytes)")
         return audio
 
@@ -92,16 +149,19 @@ class HebrewTTSClient:
         """Synthesize Hebrew text to OGG Opus audio."""
         try:
             chunks = chunk_text(text)
-            logger.info(f"Synthesizing {len(chunks)} chunk(s), {len(text)} chars total")
-
-            audio_chunks = []
-            for i, chunk in enumerate(chunks):
-                audio_bytes = self._synthesize_chunk(chunk)
-                audio_chunks.append(audio_bytes)
-                logger.debug(f"Chunk {i + 1}/{len(chunks)}: {len(audio_bytes)} bytes")
-
-            if len(audio_chunks) == 1:
-                return audio_chunks[0]
+            if not chunks:
+                return None
+            if len(chunks) == 1:
+                return self._synthesize_chunk(chunks[0])
+
+            logger.info(f"Synthesizing {len(chunks)} chunks, {len(text)} chars total")
+            # Each chunk is an independent API round trip; run them side by side
+            with ThreadPoolExecutor(
+                max_workers=min(len(chunks), MAX_PARALLEL_CHUNKS)
+            ) as executor:
+                audio_chunks = list(executor.map(self._synthesize_chunk, chunks))
+            for i, audio_bytes in enumerate(audio_chunks, 1):
+                logger.debug(f"Chunk {i}/{len(chunks)}: {len(audio_bytes)} bytes")
 
             return _concatenate_audio(audio_chunks)
 
@@ -111,6 +171,8 @@ class HebrewTTSClient:
 
     def _synthesize_chunk(self, chunk: str) -> bytes:
         """Synthesize a single text chunk via Google Cloud TTS."""
+        from google.cloud import texttospeech
+
         synthesis_input = texttospeech.SynthesisInput(text=chunk)
         response = self.client.synthesize_speech(
             input=synthesis_input,
@@ -120,107 +182,253 @@ class HebrewTTSClient:
         return response.audio_content
 
 
-def chunk_text(text: str, max_chars: int = MAX_CHUNK_CHARS) -> list[str]:
-    """Split Hebrew text into chunks for TTS synthesis."""
+# One client per credentials per process, so the gRPC channel and the temp
+# credentials file are set up once
+_clients: dict[str, HebrewTTSClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_tts_client(credentials_json: str | None = None) -> HebrewTTSClient:
+    """Get the shared TTS client for a set of credentials."""
+    key = (
+        hashlib.blake2b(credentials_json.encode(), digest_size=16).hexdigest()
+        if credentials_json
+        else ""
+    )
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = HebrewTTSClient(credentials_json)
+        return client
+
+
+def chunk_text(text: str, max_bytes: int = MAX_CHUNK_BYTES) -> list[str]:
+    """Split Hebrew text into chunks for TTS synthesis.
+
+    Chunks are budgeted in UTF-8 bytes, the unit of the API's request limit.
+    """
     text = text.strip()
     if not text:
         return []
-    if len(text) <= max_chars:
+    # A character is 1-4 UTF-8 bytes, so the length in characters usually
+    # settles whether the text fits without encoding it
+    if len(text) <= max_bytes // 4 or (
+        len(text) <= max_bytes and len(text.encode()) <= max_bytes
+    ):
         return [text]
 
-    sentence_pattern = re.compile(r"(?<=[.:׃])\s+")
-    sentences = sentence_pattern.split(text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
+    # ends[j] - ends[i] - 1 is the size of sentences[i:j] joined by spaces
+    ends = [0, *itertools.accumulate(len(s.encode()) + 1 for s in sentences)]
 
     chunks: list[str] = []
-    current = ""
-
-    for sentence in sentences:
-        candidate = f"{current} {sentence}".strip() if current else sentence
-        if len(candidate) <= max_chars:
-            current = candidate
+    # Words left over from splitting an oversized sentence, which the next
+    # sentences may still join
+    parts: list[str] = []
+    current_bytes = 0
+
+    i = 0
+    while i < len(sentences):
+        # Take every following sentence that fits in one step
+        if parts:
+            limit = ends[i] + max_bytes - current_bytes
         else:
-            if current:
-                chunks.append(current)
-            if len(sentence) > max_chars:
-                words = sentence.split()
-                current = ""
-                for word in words:
-                    candidate = f"{current} {word}".strip() if current else word
-                    if len(candidate) <= max_chars:
-                        current = candidate
-                    else:
-                        if current:
-                            chunks.append(current)
-                        current = word
+            limit = ends[i] + max_bytes + 1
+        j = bisect.bisect_right(ends, limit, i + 1) - 1
+        if j > i:
+            chunks.append(" ".join([*parts, *sentences[i:j]]))
+            parts, current_bytes = [], 0
+            i = j
+            continue
+        if parts:
+            chunks.append(" ".join(parts))
+            parts, current_bytes = [], 0
+            continue
+
+        # A single sentence over the limit is split between words
+        for word in sentences[i].split():
+            size = len(word.encode())
+            needed = current_bytes + 1 + size if parts else size
+            if needed <= max_bytes:
+                parts.append(word)
+                current_bytes = needed
             else:
-                current = sentence
+                if parts:
+                    chunks.append(" ".join(parts))
+                parts, current_bytes = [word], size
+        i += 1
 
-    if current:
-        chunks.append(current)
+    if parts:
+        chunks.append(" ".join(parts))
 
     return chunks
 
 
 def _concatenate_audio(audio_chunks: list[bytes]) -> bytes:
-    """Concatenate OGG Opus audio chunks with silence gaps."""
-    silence = AudioSegment.silent(duration=INTER_CHUNK_SILENCE_MS)
-    combined = AudioSegment.empty()
+    """Concatenate OGG Opus audio chunks with silence gaps.
 
-    for i, chunk_bytes in enumerate(audio_chunks):
-        segment = AudioSegment.from_ogg(io.BytesIO(chunk_bytes))
-        if i > 0:
-            combined += silence
-        combined += segment
+    Chunks are remuxed at the Ogg page level, so no audio is decoded or
+    re-encoded.
+    """
+    return concatenate_opus(audio_chunks, gap=_SILENCE_PACKETS)
 
-    buf = io.BytesIO()
-    combined.export(buf, format="ogg", codec="libopus")
-    return buf.getvalue()
 
+def audio_cache_key(text: str) -> str:
+    """Cache key for a text's audio, so identical halachot share one file."""
+    digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    return f"audio_{digest}"
 
-async def send_voice_for_pair(
-    bot: object,
+
+def prepare_voice_for_pair(
+    pair: DailyPair,
+    credentials_json: str | None = None,
+    *,
+    _tts_client: HebrewTTSClient | None = None,
+) -> list[tuple[str, bytes, str]]:
+    """Generate (label, audio, caption) voice payloads for a daily halacha pair.
+
+    Blocking — async callers should run it in a worker thread.
+    """
+    tts = _tts_client or get_tts_client(credentials_json)
+
+    halachot = [
+        (pair.first, audio_cache_key(pair.first.hebrew_text), "א"),
+        (pair.second, audio_cache_key(pair.second.hebrew_text), "ב"),
+    ]
+
+    # Both halachot are synthesized side by side; results keep pair order
+    with ThreadPoolExecutor(max_workers=len(halachot)) as executor:
+        audios = list(
+            executor.map(
+                lambda item: tts.get_or_generate_audio(item[0].hebrew_text, item[1]),
+                halachot,
+            )
+        )
+
+    voices = []
+    for (halacha, _, label), audio in zip(halachot, audios, strict=True):
+        if not audio:
+            logger.warning(f"TTS failed for halacha {label}, skipping voice")
+            continue
+
+        vol_he = halacha.volume.volume_he
+        caption = f"\U0001f509 {label}. {vol_he} — סימן {halacha.siman}"
+        voices.append((label, audio, caption))
+
+    return voices
+
+
+def start_voice_generation(
     pair: DailyPair,
-    chat_id: int | str,
     credentials_json: str | None = None,
-    today: date | None = None,
     *,
     _tts_client: HebrewTTSClient | None = None,
+) -> asyncio.Task[list[tuple[str, bytes, str]]]:
+    """Start generating voice audio for a pair in a worker thread.
+
+    Lets callers overlap TTS synthesis with sending the text messages, then
+    hand the task to send_generated_voice() so voice still arrives last.
+    """
+    return asyncio.create_task(
+        asyncio.to_thread(
+            prepare_voice_for_pair,
+            pair,
+            credentials_json,
+            _tts_client=_tts_client,
+        )
+    )
+
+
+def start_daily_voice_generation(
+    selector: HalachaSelector,
+    credentials_json: str | None = None,
+    *,
+    _tts_client: HebrewTTSClient | None = None,
+) -> asyncio.Task[list[tuple[str, bytes, str]]]:
+    """Start looking up today's pair and generating its voice in the background.
+
+    Unlike start_voice_generation(), the caller does not wait for the pair
+    lookup, so the text can go out first; a failed lookup surfaces in
+    send_generated_voice(), which logs it.
+    """
+
+    async def _generate() -> list[tuple[str, bytes, str]]:
+        pair = await selector.aget_daily_pair()
+        if not pair:
+            return []
+        return await asyncio.to_thread(
+            prepare_voice_for_pair, pair, credentials_json, _tts_client=_tts_client
+        )
+
+    return asyncio.create_task(_generate())
+
+
+async def send_voices(
+    bot: object,
+    chat_id: int | str,
+    voices: list[tuple[str, bytes, str]],
+    *,
+    limiter: RateLimiter | None = None,
 ) -> None:
-    """Generate and send voice messages for a daily halacha pair.
+    """Send already generated voice messages to one chat.
 
-    Non-blocking: TTS failure never raises — it logs and returns.
+    With a limiter, each send waits for its turn and is retried on flood
+    control, as in a broadcast. Unlike send_generated_voice(), send
+    failures are raised to the caller.
     """
-    if today is None:
-        today = date.today()
+    for label, audio, caption in voices:
+        send = functools.partial(
+            bot.send_voice,  # type: ignore[attr-defined]
+            chat_id=chat_id,
+            voice=audio,
+            caption=caption,
+            read_timeout=30,
+            write_timeout=30,
+        )
+        if limiter is None:
+            await send()
+        else:
+            # Imported here so this module does not need telegram
+            from .telegram_client import send_paced
 
-    try:
-        tts = _tts_client or HebrewTTSClient(credentials_json)
-        today_str = today.isoformat()
-
-        halachot = [
-            (pair.first, f"audio_{today_str}_1", "א"),
-            (pair.second, f"audio_{today_str}_2", "ב"),
-        ]
-
-        for halacha, cache_key, label in halachot:
-            audio = tts.get_or_generate_audio(halacha.hebrew_text, cache_key)
-            if not audio:
-                logger.warning(f"TTS failed for halacha {label}, skipping voice")
-                continue
-
-            vol_he = halacha.volume.volume_he
-            caption = f"\U0001f509 {label}. {vol_he} — סימן {halacha.siman}"
-
-            await bot.send_voice(  # type: ignore[attr-defined]
-                chat_id=chat_id,
-                voice=audio,
-                caption=caption,
-                read_timeout=30,
-                write_timeout=30,
-            )
-            logger.info(f"Voice message {label} sent to {chat_id}")
+            await send_paced(limiter, send)
+        logger.info(f"Voice message {label} sent to {chat_id}")
 
-        logger.info(f"Voice messages completed for {chat_id}")
+    logger.info(f"Voice messages completed for {chat_id}")
+
+
+async def send_generated_voice(
+    bot: object,
+    chat_id: int | str,
+    pending: asyncio.Task[list[tuple[str, bytes, str]]],
+    *,
+    limiter: RateLimiter | None = None,
+) -> None:
+    """Await a voice generation task and send the resulting voice messages.
+
+    Non-blocking: TTS failure never raises — it logs and returns.
+    """
+    try:
+        # Shielded: the task may be shared by several chats, and one of them
+        # being cancelled must not cancel it for the rest
+        voices = await asyncio.shield(pending)
+        await send_voices(bot, chat_id, voices, limiter=limiter)
 
     except Exception:
         logger.exception(f"Voice message delivery failed for {chat_id}")
+
+
+async def send_voice_for_pair(
+    bot: object,
+    pair: DailyPair,
+    chat_id: int | str,
+    credentials_json: str | None = None,
+    *,
+    _tts_client: HebrewTTSClient | None = None,
+) -> None:
+    """Generate and send voice messages for a daily halacha pair.
+
+    Non-blocking: TTS failure never raises — it logs and returns.
+    """
+    pending = start_voice_generation(pair, credentials_json, _tts_client=_tts_client)
+    await send_generated_voice(bot, chat_id, pending)
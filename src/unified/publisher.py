@@ -5,34 +5,49 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import random
 from typing import Any
 
-from telegram import Bot
 from telegram.constants import ParseMode
-from telegram.error import TelegramError
+from telegram.error import RetryAfter, TelegramError
+
+from ..telegram_client import get_bot, retry_after_seconds
 
 logger = logging.getLogger(__name__)
 
 UNIFIED_CHANNEL_ID = os.getenv("TORAH_YOMI_CHANNEL_ID")
 UNIFIED_BOT_TOKEN = os.getenv("TORAH_YOMI_CHANNEL_BOT_TOKEN")
 PUBLISH_ENABLED = os.getenv("TORAH_YOMI_PUBLISH_ENABLED", "true").lower() == "true"
+_ENABLED = PUBLISH_ENABLED and bool(UNIFIED_CHANNEL_ID) and bool(UNIFIED_BOT_TOKEN)
 
 SOURCE = "shulchan_aruch"
 BADGE = "📖 Shulchan Aruch | שולחן ערוך"
+_UNIFIED_HEADER = f"{BADGE}\n{'─' * 30}\n\n"
 
 MAX_RETRIES = 3
 RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 10.0
 
 
 def format_for_unified_channel(content: str) -> str:
     """Format message with unified channel header."""
-    header = f"{BADGE}\n{'─' * 30}\n\n"
-    return f"{header}{content}"
+    return _UNIFIED_HEADER + content
+
+
+def _retry_delay(attempt: int, error: TelegramError) -> float:
+    """Seconds to wait before retrying a failed publish.
+
+    Honors Telegram's flood-control wait when given; otherwise uses capped
+    exponential backoff with full jitter so concurrent retries spread out.
+    """
+    if isinstance(error, RetryAfter):
+        return retry_after_seconds(error)
+    return random.uniform(0, min(RETRY_DELAY * 2 ** (attempt - 1), MAX_RETRY_DELAY))
 
 
 def is_unified_channel_enabled() -> bool:
     """Check if unified channel publishing is enabled."""
-    return PUBLISH_ENABLED and bool(UNIFIED_CHANNEL_ID) and bool(UNIFIED_BOT_TOKEN)
+    return _ENABLED
 
 
 class TorahYomiPublisher:
@@ -60,24 +75,23 @@ class TorahYomiPublisher:
 
         formatted_text = format_for_unified_channel(text)
 
-        bot = Bot(token=UNIFIED_BOT_TOKEN)
+        bot = await get_bot(UNIFIED_BOT_TOKEN)
         channel_id = UNIFIED_CHANNEL_ID
-        async with bot:
-            for attempt in range(1, MAX_RETRIES + 1):
-                try:
-                    await bot.send_message(
-                        chat_id=channel_id,
-                        text=formatted_text,
-                        parse_mode=parse_mode,
-                        disable_web_page_preview=disable_web_page_preview,
-                        **kwargs,
-                    )
-                    logger.info(f"Published text to unified channel ({SOURCE})")
-                    return True
-                except TelegramError as e:
-                    logger.error(f"Publish attempt {attempt} failed: {e}")
-                    if attempt < MAX_RETRIES:
-                        await asyncio.sleep(RETRY_DELAY * attempt)
+        for attempt in range(1, MAX_RETRIES + 1):
+            try:
+                await bot.send_message(
+                    chat_id=channel_id,
+                    text=formatted_text,
+                    parse_mode=parse_mode,
+                    disable_web_page_preview=disable_web_page_preview,
+                    **kwargs,
+                )
+                logger.info(f"Published text to unified channel ({SOURCE})")
+                return True
+            except TelegramError as e:
+                logger.error(f"Publish attempt {attempt} failed: {e}")
+                if attempt < MAX_RETRIES:
+                    await asyncio.sleep(_retry_delay(attempt, e))
 
         logger.error("All publish attempts failed")
         return False
@@ -0,0 +1,71 @@
+"""Tests for the daily broadcast."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.bot import ShulchanAruchYomiBot
+from src.config import Config
+
+
+def _broadcast_bot(sample_pair, subscribers, **config_kwargs):
+    config = Config(
+        telegram_bot_token="token", telegram_chat_id="-100", **config_kwargs
+    )
+    app_bot = ShulchanAruchYomiBot(config)
+    app_bot.selector.aget_daily_pair = AsyncMock(return_value=sample_pair)
+    telegram_bot = MagicMock()
+    patches = (
+        patch("src.bot.get_bot", AsyncMock(return_value=telegram_bot)),
+        patch("src.bot.load_subscribers", return_value=frozenset(subscribers)),
+    )
+    return app_bot, telegram_bot, patches
+
+
+async def test_broadcast_reaches_channel_and_subscribers(sample_pair):
+    app_bot, telegram_bot, (get_bot, load) = _broadcast_bot(sample_pair, {1, 2})
+    telegram_bot.send_message = AsyncMock(return_value=MagicMock(message_id=5))
+    with get_bot, load:
+        assert await app_bot.send_daily_broadcast() is True
+    chats = {call.kwargs["chat_id"] for call in telegram_bot.send_message.mock_calls}
+    assert chats == {"-100", 1, 2}
+
+
+async def test_failed_channel_post_messages_no_subscribers(sample_pair):
+    app_bot, telegram_bot, (get_bot, load) = _broadcast_bot(sample_pair, {1, 2})
+    telegram_bot.send_message = AsyncMock(return_value=None)
+    with get_bot, load:
+        assert await app_bot.send_daily_broadcast() is False
+    chats = {call.kwargs["chat_id"] for call in telegram_bot.send_message.mock_calls}
+    assert chats == {"-100"}
+
+
+async def test_failed_voice_generation_is_logged_once(sample_pair, caplog):
+    app_bot, telegram_bot, (get_bot, load) = _broadcast_bot(
+        sample_pair, {1, 2}, google_tts_enabled=True
+    )
+    telegram_bot.send_message = AsyncMock(return_value=MagicMock(message_id=5))
+    telegram_bot.send_voice = AsyncMock()
+    failing = patch("src.tts.prepare_voice_for_pair", side_effect=RuntimeError)
+    with get_bot, load, failing:
+        assert await app_bot.send_daily_broadcast() is True
+    telegram_bot.send_voice.assert_not_called()
+    errors = [r for r in caplog.records if r.levelname == "ERROR"]
+    assert len(errors) == 1
+
+
+async def test_failed_voice_sends_are_counted(sample_pair, caplog):
+    app_bot, telegram_bot, (get_bot, load) = _broadcast_bot(
+        sample_pair, {1, 2}, google_tts_enabled=True
+    )
+    telegram_bot.send_message = AsyncMock(return_value=MagicMock(message_id=5))
+
+    async def send_voice(chat_id, **kwargs):
+        if chat_id == 2:
+            raise RuntimeError("blocked")
+
+    telegram_bot.send_voice = AsyncMock(side_effect=send_voice)
+    voices = [("A", b"audio", "caption")]
+    with get_bot, load, patch("src.tts.prepare_voice_for_pair", return_value=voices):
+        assert await app_bot.send_daily_broadcast() is True
+    chats = {call.kwargs["chat_id"] for call in telegram_bot.send_voice.mock_calls}
+    assert chats == {"-100", 1, 2}
+    assert "Failed to send voice to 1 subscribers" in caplog.text
@@ -3,10 +3,12 @@
 from datetime import date
 
 from src.formatter import (
+    coalesce_messages,
     format_daily_message,
     format_error_message,
     format_halacha_messages,
     format_info_message,
+    format_unified_message,
     format_welcome_message,
     split_text,
 )
@@ -22,6 +24,11 @@ def test_split_text_at_boundary():
     assert chunks == ["hello world", "foo bar"]
 
 
+def test_split_text_strips_whitespace_between_chunks():
+    text = "hello world  \nfoo bar baz"
+    assert split_text(text, 12) == ["hello world", "foo bar baz"]
+
+
 def test_split_text_no_space():
     text = "a" * 20
     chunks = split_text(text, 10)
@@ -56,6 +63,13 @@ def test_format_daily_message(sample_pair):
     assert "יורה דעה" in combined
 
 
+def test_format_daily_message_is_memoized(sample_pair):
+    msgs = format_daily_message(sample_pair, date(2026, 2, 16))
+    msgs.append("mutated by caller")
+    assert format_daily_message(sample_pair, date(2026, 2, 16)) == msgs[:-1]
+    assert format_daily_message(sample_pair, date(2026, 2, 17)) != msgs[:-1]
+
+
 def test_format_welcome_message():
     msg = format_welcome_message()
     assert "שולחן ערוך יומי" in msg
@@ -79,3 +93,27 @@ def test_message_length(sample_pair):
     msgs = format_daily_message(sample_pair, date(2026, 2, 16))
     for msg in msgs:
         assert len(msg) <= 4096
+
+
+def test_coalesce_messages_merges_short():
+    assert coalesce_messages(["<b>a</b>", "b", "c"], limit=100) == [
+        "<b>a</b>\n\nb\n\nc"
+    ]
+
+
+def test_coalesce_messages_respects_limit():
+    msgs = ["a" * 60, "b" * 60]
+    assert coalesce_messages(msgs, limit=100) == msgs
+
+
+def test_coalesce_messages_skips_unbalanced_html():
+    msgs = ["<b>open", "close</b>"]
+    assert coalesce_messages(msgs, limit=100) == msgs
+
+
+def test_format_unified_message(sample_pair):
+    msg = format_unified_message(sample_pair, date(2026, 2, 16))
+    assert msg.startswith("<b>שולחן ערוך יומי</b>\n📅 16/02/2026\n\n")
+    assert "<b>א׳</b> אורח חיים — סימן 1\n" in msg
+    assert "<b>ב׳</b> יורה דעה — סימן 1\n" in msg
+    assert msg.endswith(f"{sample_pair.second.hebrew_text}\n")
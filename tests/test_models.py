@@ -73,3 +73,32 @@ def test_daily_pair_validates_different_volumes(sample_halacha_1, sample_volume_
 def test_daily_pair_different_volumes(sample_pair):
     assert sample_pair.first.volume.volume != sample_pair.second.volume.volume
     assert sample_pair.date_seed == "2026-02-16"
+
+
+def test_halacha_hash_matches_equality(sample_halacha_1):
+    copy = Halacha(
+        volume=sample_halacha_1.volume,
+        siman=sample_halacha_1.siman,
+        seif=sample_halacha_1.seif,
+        hebrew_text=sample_halacha_1.hebrew_text,
+        sefaria_url=sample_halacha_1.sefaria_url,
+    )
+    assert copy == sample_halacha_1
+    assert hash(copy) == hash(sample_halacha_1)
+    assert not hasattr(copy, "__dict__")
+
+
+def test_halacha_preview_short(sample_halacha_1):
+    assert sample_halacha_1.preview_he == sample_halacha_1.hebrew_text
+
+
+def test_halacha_preview_keeps_niqqud_with_letter(sample_volume_oc):
+    # "שָׁלוֹם " repeated: every letter carries combining niqqud marks
+    text = "שָׁלוֹם " * 60
+    h = Halacha(
+        volume=sample_volume_oc, siman=1, seif=None, hebrew_text=text, sefaria_url=""
+    )
+    assert h.preview_he.endswith("...")
+    body = h.preview_he[:-3]
+    assert len(body) <= 200
+    assert body.endswith("שָׁלוֹם")
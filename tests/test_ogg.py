@@ -0,0 +1,141 @@
+"""Tests for Ogg Opus remuxing."""
+
+import shutil
+import struct
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.ogg import (
+    BOS,
+    EOS,
+    _crc32,
+    _page,
+    concatenate_opus,
+    opus_packet_samples,
+    read_packets,
+    read_stream,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+HEAD = b"OpusHead\x01\x01\x38\x01\x80\xbb\x00\x00\x00\x00\x00"
+TAGS = b"OpusTags\x00\x00\x00\x00\x00\x00\x00\x00"
+FRAME_20MS = b"\xf8\xff\xfe"  # CELT fullband, 20 ms
+
+
+def _opus_file(audio: list[bytes], serial: int) -> bytes:
+    """Build a minimal Ogg Opus file, one audio packet per page."""
+    pages = [_page([HEAD], 0, serial, 0, BOS), _page([TAGS], 0, serial, 1)]
+    granule = 0
+    for i, packet in enumerate(audio):
+        granule += opus_packet_samples(packet)
+        flags = EOS if i == len(audio) - 1 else 0
+        pages.append(_page([packet], granule, serial, i + 2, flags))
+    return b"".join(pages)
+
+
+def _pages(data: bytes) -> list[tuple[int, int, int, int, bool]]:
+    """Parse (flags, granule, serial, seqno, crc_ok) for every page."""
+    pages = []
+    pos = 0
+    while pos < len(data):
+        _, _, flags, granule, serial, seqno, crc, segments = struct.unpack_from(
+            "<4sBBqIIIB", data, pos
+        )
+        length = 27 + segments + sum(data[pos + 27 : pos + 27 + segments])
+        page = bytearray(data[pos : pos + length])
+        page[22:26] = b"\x00\x00\x00\x00"
+        pages.append((flags, granule, serial, seqno, _crc32(page) == crc))
+        pos += length
+    return pages
+
+
+def test_crc32_check_value():
+    assert _crc32(b"123456789") == 0x89A1897F
+
+
+def test_opus_packet_samples():
+    assert opus_packet_samples(FRAME_20MS) == 960
+    assert opus_packet_samples(bytes([0x08])) == 960  # SILK NB 20 ms
+    assert opus_packet_samples(bytes([0x79])) == 1920  # Hybrid FB 20 ms x2
+    assert opus_packet_samples(bytes([0xFB, 0x03])) == 2880  # CELT 20 ms x3
+
+
+def test_read_packets_across_lacing_boundary():
+    big = b"\xf8" + b"x" * 600
+    packets = read_packets(_opus_file([big, FRAME_20MS], serial=7))
+    assert packets == [HEAD, TAGS, big, FRAME_20MS]
+
+
+def test_concatenate_opus():
+    first = _opus_file([FRAME_20MS] * 3, serial=1)
+    second = _opus_file([b"\xfc\x01\x02"] * 2, serial=2)
+    gap = [b"\xf8\xff\xfe"] * 5
+
+    joined = concatenate_opus([first, second], gap=gap)
+
+    assert read_packets(joined) == [
+        HEAD,
+        TAGS,
+        *[FRAME_20MS] * 3,
+        *gap,
+        *[b"\xfc\x01\x02"] * 2,
+    ]
+    pages = _pages(joined)
+    assert all(crc_ok for *_, crc_ok in pages)
+    assert {serial for _, _, serial, _, _ in pages} == {1}
+    assert [seqno for _, _, _, seqno, _ in pages] == list(range(len(pages)))
+    assert pages[0][0] == BOS
+    assert pages[-1][0] == EOS
+    assert pages[-1][1] == 960 * 10
+
+
+def test_concatenate_rejects_non_opus():
+    with pytest.raises(ValueError):
+        concatenate_opus([_page([b"vorbis"], 0, 1, 0, BOS)])
+
+
+def _decoded_samples(data: bytes) -> int:
+    """Decode with ffmpeg and count the 48 kHz mono samples it produces."""
+    result = subprocess.run(
+        ["ffmpeg", "-v", "error", "-xerror", "-i", "pipe:0"]
+        + ["-f", "s16le", "-ac", "1", "-ar", "48000", "pipe:1"],
+        input=data,
+        capture_output=True,
+        check=True,
+    )
+    assert not result.stderr
+    return len(result.stdout) // 2
+
+
+def test_concatenate_real_opus_files():
+    # Multi-page libopus output (48 kHz granules, pre-skip 312, end trim)
+    first = (FIXTURES / "tts_chunk_a.ogg").read_bytes()
+    second = (FIXTURES / "tts_chunk_b.ogg").read_bytes()
+    gap = [FRAME_20MS] * 15
+
+    joined = concatenate_opus([first, second], gap=gap)
+
+    first_packets, _ = read_stream(first)
+    second_packets, second_granule = read_stream(second)
+    packets, granule = read_stream(joined)
+    assert packets == first_packets + gap + second_packets[2:]
+
+    end_trim = sum(map(opus_packet_samples, second_packets[2:])) - second_granule
+    assert end_trim > 0
+    assert granule == sum(map(opus_packet_samples, packets[2:])) - end_trim
+    assert all(crc_ok for *_, crc_ok in _pages(joined))
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_concatenated_real_opus_decodes():
+    first = (FIXTURES / "tts_chunk_a.ogg").read_bytes()
+    second = (FIXTURES / "tts_chunk_b.ogg").read_bytes()
+
+    joined = concatenate_opus([first, second], gap=[FRAME_20MS] * 15)
+
+    _, granule = read_stream(joined)
+    pre_skip = struct.unpack_from("<H", read_packets(joined)[0], 10)[0]
+    assert _decoded_samples(joined) == granule - pre_skip
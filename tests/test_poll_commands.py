@@ -0,0 +1,44 @@
+"""Tests for the command polling script."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from scripts.poll_commands import _DailyVoice, handle_command
+from src.config import Config
+
+
+async def test_batch_generates_voice_once():
+    config = Config(
+        telegram_bot_token="token", telegram_chat_id="1", google_tts_enabled=True
+    )
+    selector = MagicMock()
+    bot = MagicMock()
+    bot.send_message = AsyncMock()
+    bot.send_voice = AsyncMock()
+
+    async def generate():
+        return [("א", b"audio", "caption")]
+
+    def start(*_args, **_kwargs):
+        return asyncio.create_task(generate())
+
+    with (
+        patch("scripts.poll_commands.get_today_messages", return_value=["text"]),
+        patch(
+            "scripts.poll_commands.start_daily_voice_generation", side_effect=start
+        ) as start_generation,
+    ):
+        voice = _DailyVoice(selector, config)
+        await asyncio.gather(
+            handle_command(bot, 10, "/today", selector, config, voice),
+            handle_command(bot, 20, "/today", selector, config, voice),
+        )
+
+    start_generation.assert_called_once()
+    voiced = {call.kwargs["chat_id"] for call in bot.send_voice.await_args_list}
+    assert voiced == {10, 20}
+
+
+async def test_no_voice_when_tts_disabled():
+    config = Config(telegram_bot_token="token", telegram_chat_id="1")
+    assert _DailyVoice(MagicMock(), config).start() is None
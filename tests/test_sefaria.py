@@ -1,9 +1,11 @@
 """Tests for Sefaria API client."""
 
+from unittest.mock import patch
+
 import pytest
 import responses
 
-from src.models import Volume
+from src.models import Halacha, Volume
 from src.sefaria import SefariaClient
 
 
@@ -32,6 +34,12 @@ def test_load_catalog(client):
     assert "Choshen Mishpat" in names
 
 
+def test_catalog_loaded_once_per_process(client):
+    other = SefariaClient()
+    assert other.catalog is not client.catalog
+    assert other.catalog[0] is client.catalog[0]
+
+
 def test_get_volume(client):
     vol = client.get_volume("Orach Chaim")
     assert vol is not None
@@ -145,3 +153,37 @@ def test_fetch_full_siman_string_response(client, sample_volume):
     halacha = client.fetch_full_siman(sample_volume, 50)
     assert halacha is not None
     assert "פסוק יחיד" in halacha.hebrew_text
+
+
+def test_clients_share_session():
+    """All clients reuse one keep-alive session."""
+    assert SefariaClient().session is SefariaClient().session
+
+
+def test_random_halacha_picks_earliest_valid_candidate(client, sample_volume):
+    """Concurrent retries still return the first valid siman in draw order."""
+
+    def fetch(volume, siman):
+        if siman in (3, 5):
+            return Halacha(
+                volume=volume,
+                siman=siman,
+                seif=None,
+                hebrew_text="טקסט ארוך מספיק להלכה.",
+                sefaria_url="",
+            )
+        return None
+
+    with patch.object(client, "fetch_full_siman", side_effect=fetch):
+        halacha = client.get_random_halacha_from_volume(sample_volume, range(1, 11))
+
+    assert halacha is not None
+    assert halacha.siman == 3
+
+
+def test_random_halacha_skips_repeated_candidates(client, sample_volume):
+    with patch.object(client, "fetch_full_siman", return_value=None) as fetch:
+        halacha = client.get_random_halacha_from_volume(sample_volume, [4, 2, 4, 2])
+
+    assert halacha is None
+    assert sorted(call.args[1] for call in fetch.call_args_list) == [2, 4]
@@ -1,5 +1,6 @@
 """Tests for daily halacha selection."""
 
+import asyncio
 import tempfile
 from datetime import date
 from pathlib import Path
@@ -8,7 +9,13 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.models import Halacha, Volume
-from src.selector import HalachaSelector, _memory_cache, _message_cache
+from src.selector import (
+    HalachaSelector,
+    _candidate_simanim,
+    _LRUCache,
+    _memory_cache,
+    _message_cache,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -101,14 +108,33 @@ def test_volumes_are_different(selector):
         assert vol1.volume != vol2.volume
 
 
+def test_lru_cache_evicts_least_recently_used():
+    cache: _LRUCache[int] = _LRUCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1
+    cache["c"] = 3
+    assert list(cache) == ["a", "c"]
+
+
+def test_candidate_simanim_deterministic(mock_client):
+    """Candidates are stable per date and volume and stay in range."""
+    vol = mock_client.catalog[2]
+    candidates = _candidate_simanim("2026-02-16", vol)
+    assert candidates == _candidate_simanim("2026-02-16", vol)
+    assert candidates != _candidate_simanim("2026-02-17", vol)
+    assert len(candidates) == 10
+    assert all(1 <= siman <= vol.max_siman for siman in candidates)
+
+
 def test_get_daily_pair_with_mock_api(selector, mock_client):
     """Test the full selection flow with mocked API."""
 
-    def mock_random(volume, rng):
+    def mock_random(volume, candidates):
         """Return a halacha with the correct volume."""
         return Halacha(
             volume=volume,
-            siman=rng.randint(1, 10),
+            siman=candidates[0],
             seif=None,
             hebrew_text="יתגבר כארי לעמוד בבוקר לעבודת בוראו שיהא הוא מעורר השחר.",
             sefaria_url=f"https://www.sefaria.org/{volume.ref_base}.1",
@@ -121,3 +147,42 @@ def test_get_daily_pair_with_mock_api(selector, mock_client):
 
     assert pair is not None
     assert pair.first.volume.volume != pair.second.volume.volume
+
+
+def test_fallback_pair_messages_are_cached(selector, mock_client):
+    """Messages are cached even when a fallback pair is not saved to disk."""
+    mock_client.get_random_halacha_from_volume.return_value = None
+    cache_dir = Path(tempfile.mkdtemp())
+
+    with patch("src.selector.CACHE_DIR", cache_dir):
+        pair = selector.get_daily_pair(date(2026, 2, 16))
+        messages = selector.get_cached_messages(date(2026, 2, 16))
+
+    assert pair is not None
+    assert messages is not None
+    assert "לא ניתן לטעון" in "".join(messages)
+    assert not any(cache_dir.iterdir())
+
+
+def test_cached_pair_reuses_catalog_volumes(selector, mock_client, sample_pair):
+    """Pairs loaded from disk point at the shared catalog volumes."""
+    with patch("src.selector.CACHE_DIR", Path(tempfile.mkdtemp())):
+        selector._save_cached_pair(sample_pair, date(2026, 2, 16)).result()
+        pair = selector._load_cached_pair(date(2026, 2, 16))
+
+    assert pair is not None
+    assert pair.first.volume is mock_client.get_volume(sample_pair.first.volume.volume)
+    assert pair.second.volume is mock_client.get_volume(
+        sample_pair.second.volume.volume
+    )
+
+
+async def test_aget_daily_pair_coalesces_concurrent_calls(selector, sample_pair):
+    """Concurrent async callers for one date share a single lookup."""
+    with patch.object(selector, "get_daily_pair", return_value=sample_pair) as get:
+        pairs = await asyncio.gather(
+            *(selector.aget_daily_pair(date(2026, 2, 16)) for _ in range(5))
+        )
+
+    assert all(p is sample_pair for p in pairs)
+    get.assert_called_once_with(date(2026, 2, 16))
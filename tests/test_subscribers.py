@@ -6,6 +6,7 @@ from unittest.mock import patch
 
 from src.subscribers import (
     add_subscriber,
+    batch_updates,
     get_subscriber_count,
     is_subscribed,
     load_subscribers,
@@ -73,3 +74,98 @@ def test_subscriber_count():
         add_subscriber(2)
         add_subscriber(3)
         assert get_subscriber_count() == 3
+
+
+def test_load_reuses_cached_set():
+    state_dir, subs_file = _temp_state()
+    with (
+        patch("src.subscribers.SUBSCRIBERS_FILE", subs_file),
+        patch("src.subscribers.STATE_DIR", state_dir),
+    ):
+        save_subscribers({1, 2})
+        assert load_subscribers() is load_subscribers()
+
+
+def test_load_sees_external_changes():
+    state_dir, subs_file = _temp_state()
+    with (
+        patch("src.subscribers.SUBSCRIBERS_FILE", subs_file),
+        patch("src.subscribers.STATE_DIR", state_dir),
+    ):
+        save_subscribers({1})
+        assert load_subscribers() == {1}
+        subs_file.write_text('{"subscribers": [1, 2, 3]}')
+        assert load_subscribers() == {1, 2, 3}
+
+
+def test_corrupt_file_parsed_once():
+    _, subs_file = _temp_state()
+    subs_file.write_text("{not json")
+    with patch("src.subscribers.SUBSCRIBERS_FILE", subs_file):
+        assert load_subscribers() == set()
+        with patch.object(Path, "read_bytes") as read_bytes:
+            assert load_subscribers() == set()
+        read_bytes.assert_not_called()
+
+
+def test_save_writes_sorted_file_with_trailing_newline():
+    state_dir, subs_file = _temp_state()
+    with (
+        patch("src.subscribers.SUBSCRIBERS_FILE", subs_file),
+        patch("src.subscribers.STATE_DIR", state_dir),
+    ):
+        save_subscribers({3, 1, 2})
+    assert (
+        subs_file.read_text()
+        == '{\n  "subscribers": [\n    1,\n    2,\n    3\n  ]\n}\n'
+    )
+
+
+def test_save_leaves_no_temp_files():
+    state_dir, subs_file = _temp_state()
+    with (
+        patch("src.subscribers.SUBSCRIBERS_FILE", subs_file),
+        patch("src.subscribers.STATE_DIR", state_dir),
+    ):
+        save_subscribers({1, 2, 3})
+        assert [p.name for p in state_dir.iterdir()] == ["subscribers.json"]
+
+
+def test_batch_updates_saves_once():
+    state_dir, subs_file = _temp_state()
+    with (
+        patch("src.subscribers.SUBSCRIBERS_FILE", subs_file),
+        patch("src.subscribers.STATE_DIR", state_dir),
+        patch("src.subscribers.save_subscribers", wraps=save_subscribers) as save,
+    ):
+        with batch_updates():
+            assert add_subscriber(1) is True
+            assert add_subscriber(2) is True
+            assert remove_subscriber(1) is True
+            assert is_subscribed(2) is True
+            assert not subs_file.exists()
+        save.assert_called_once()
+        assert load_subscribers() == {2}
+
+
+def test_batch_updates_without_changes_does_not_write():
+    state_dir, subs_file = _temp_state()
+    with (
+        patch("src.subscribers.SUBSCRIBERS_FILE", subs_file),
+        patch("src.subscribers.STATE_DIR", state_dir),
+    ):
+        with batch_updates():
+            assert remove_subscriber(1) is False
+        assert not subs_file.exists()
+
+
+def test_save_creates_missing_state_dir():
+    state_dir, _ = _temp_state()
+    state_dir = state_dir / "nested"
+    subs_file = state_dir / "subscribers.json"
+    with (
+        patch("src.subscribers.SUBSCRIBERS_FILE", subs_file),
+        patch("src.subscribers.STATE_DIR", state_dir),
+    ):
+        save_subscribers({7})
+        assert load_subscribers() == {7}
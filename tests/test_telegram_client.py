@@ -0,0 +1,40 @@
+"""Tests for the shared Telegram client helpers."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from telegram.error import RetryAfter
+
+from src.telegram_client import MAX_SEND_ATTEMPTS, RateLimiter, send_paced
+
+
+async def test_rate_limiter_spaces_calls():
+    limiter = RateLimiter(rate=10)
+    with patch("src.telegram_client.asyncio.sleep", AsyncMock()) as sleep:
+        for _ in range(4):
+            await limiter.wait()
+    delays = [call.args[0] for call in sleep.await_args_list]
+    assert delays == pytest.approx([0.1, 0.2, 0.3], abs=0.01)
+
+
+async def test_rate_limiter_pause_delays_next_call():
+    limiter = RateLimiter(rate=1000)
+    limiter.pause(5)
+    with patch("src.telegram_client.asyncio.sleep", AsyncMock()) as sleep:
+        await limiter.wait()
+    assert sleep.await_args.args[0] == pytest.approx(5, abs=0.01)
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+async def test_send_paced_retries_after_flood_control():
+    send = AsyncMock(side_effect=[RetryAfter(0), "sent"])
+    assert await send_paced(RateLimiter(rate=1000), send) == "sent"
+    assert send.await_count == 2
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+async def test_send_paced_gives_up_after_max_attempts():
+    send = AsyncMock(side_effect=RetryAfter(0))
+    with pytest.raises(RetryAfter):
+        await send_paced(RateLimiter(rate=1000), send)
+    assert send.await_count == MAX_SEND_ATTEMPTS
@@ -1,8 +1,21 @@
 """Tests for TTS module."""
 
-from unittest.mock import MagicMock
-
-from src.tts import chunk_text, is_tts_enabled
+import asyncio
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.config import Config
+from src.tts import (
+    HebrewTTSClient,
+    audio_cache_key,
+    chunk_text,
+    get_tts_client,
+    is_tts_enabled,
+    send_generated_voice,
+    send_voice_for_pair,
+    start_daily_voice_generation,
+)
 
 
 def test_chunk_text_short():
@@ -16,15 +29,15 @@ def test_chunk_text_empty():
 
 def test_chunk_text_long():
     text = "word " * 500  # ~2500 chars
-    chunks = chunk_text(text, max_chars=100)
+    chunks = chunk_text(text, max_bytes=100)
     assert len(chunks) > 1
     for chunk in chunks:
-        assert len(chunk) <= 100
+        assert len(chunk.encode()) <= 100
 
 
 def test_chunk_text_sentence_boundaries():
     text = "First sentence. Second sentence. Third sentence."
-    chunks = chunk_text(text, max_chars=35)
+    chunks = chunk_text(text, max_bytes=35)
     assert len(chunks) >= 2
     # Should split at sentence boundary
     assert chunks[0].endswith("sentence.")
@@ -32,8 +45,67 @@ def test_chunk_text_sentence_boundaries():
 
 def test_chunk_text_hebrew():
     text = "הלכה ראשונה. הלכה שניה: הלכה שלישית."
-    chunks = chunk_text(text, max_chars=25)
+    chunks = chunk_text(text, max_bytes=25)
     assert len(chunks) >= 2
+    # Hebrew letters are two bytes each in UTF-8
+    assert all(len(chunk.encode()) <= 25 for chunk in chunks)
+
+
+def test_synthesize_text_keeps_chunk_order():
+    tts = HebrewTTSClient.__new__(HebrewTTSClient)
+    tts._temp_creds_path = None
+
+    def synthesize(chunk):
+        # Later chunks finish first; the result must still follow text order
+        time.sleep(0.01 * (3 - int(chunk[-1])))
+        return chunk.encode()
+
+    with (
+        patch("src.tts.chunk_text", return_value=["c1", "c2", "c3"]),
+        patch.object(tts, "_synthesize_chunk", side_effect=synthesize),
+        patch("src.tts._concatenate_audio", side_effect=b"|".join),
+    ):
+        assert tts.synthesize_text("text") == b"c1|c2|c3"
+
+
+def test_cached_audio_read_once(tmp_path):
+    tts = HebrewTTSClient.__new__(HebrewTTSClient)
+    (tmp_path / "audio_x.ogg").write_bytes(b"cached")
+
+    with (
+        patch("src.tts.AUDIO_CACHE_DIR", tmp_path),
+        patch.object(tts, "synthesize_text") as synthesize,
+        patch.object(Path, "read_bytes", autospec=True, return_value=b"cached") as read,
+    ):
+        assert tts.get_or_generate_audio("text", "audio_x") == b"cached"
+        assert tts.get_or_generate_audio("text", "audio_x") == b"cached"
+
+    synthesize.assert_not_called()
+    read.assert_called_once()
+
+
+def test_generated_audio_cached_atomically(tmp_path):
+    tts = HebrewTTSClient.__new__(HebrewTTSClient)
+    cache_dir = tmp_path / "audio"
+
+    with (
+        patch("src.tts.AUDIO_CACHE_DIR", cache_dir),
+        patch.object(tts, "synthesize_text", return_value=b"fresh"),
+    ):
+        assert tts.get_or_generate_audio("text", "audio_y") == b"fresh"
+
+    assert [p.name for p in cache_dir.iterdir()] == ["audio_y.ogg"]
+    assert (cache_dir / "audio_y.ogg").read_bytes() == b"fresh"
+
+
+def test_get_tts_client_reuses_client_per_credentials():
+    with (
+        patch.dict("src.tts._clients", clear=True),
+        patch("src.tts.HebrewTTSClient", side_effect=lambda creds: object()),
+    ):
+        first = get_tts_client('{"key": 1}')
+        assert get_tts_client('{"key": 1}') is first
+        assert get_tts_client('{"key": 2}') is not first
 
 
 def test_is_tts_enabled_none():
@@ -41,12 +113,70 @@ def test_is_tts_enabled_none():
 
 
 def test_is_tts_enabled_false():
-    config = MagicMock()
-    config.google_tts_enabled = False
+    config = Config(
+        telegram_bot_token="token", telegram_chat_id="1", google_tts_enabled=False
+    )
     assert is_tts_enabled(config) is False
 
 
 def test_is_tts_enabled_true():
-    config = MagicMock()
-    config.google_tts_enabled = True
+    config = Config(
+        telegram_bot_token="token", telegram_chat_id="1", google_tts_enabled=True
+    )
     assert is_tts_enabled(config) is True
+
+
+async def test_send_voice_for_pair(sample_pair):
+    tts = MagicMock()
+    first_key = audio_cache_key(sample_pair.first.hebrew_text)
+    tts.get_or_generate_audio.side_effect = lambda text, key: (
+        b"audio1" if key == first_key else None
+    )
+    bot = MagicMock()
+    bot.send_voice = AsyncMock()
+
+    await send_voice_for_pair(bot, sample_pair, 42, _tts_client=tts)
+
+    tts.get_or_generate_audio.assert_any_call(sample_pair.first.hebrew_text, first_key)
+    # Second halacha failed TTS, so only one voice message goes out
+    bot.send_voice.assert_awaited_once()
+    assert bot.send_voice.await_args.kwargs["voice"] == b"audio1"
+
+
+def test_audio_cache_key_depends_only_on_text():
+    assert audio_cache_key("הלכה") == audio_cache_key("הלכה")
+    assert audio_cache_key("הלכה") != audio_cache_key("הלכות")
+
+
+async def test_daily_voice_lookup_does_not_block_caller(sample_pair):
+    selector = MagicMock()
+    lookup_started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_lookup():
+        lookup_started.set()
+        await release.wait()
+        return sample_pair
+
+    selector.aget_daily_pair = slow_lookup
+    tts = MagicMock()
+    tts.get_or_generate_audio.return_value = b"audio"
+
+    task = start_daily_voice_generation(selector, _tts_client=tts)
+    await lookup_started.wait()
+    assert not task.done()  # caller was free to send text meanwhile
+
+    release.set()
+    voices = await task
+    assert [label for label, _, _ in voices] == ["א", "ב"]
+
+
+async def test_daily_voice_lookup_failure_is_logged_not_raised():
+    selector = MagicMock()
+    selector.aget_daily_pair = AsyncMock(side_effect=RuntimeError("sefaria down"))
+    bot = MagicMock()
+    bot.send_voice = AsyncMock()
+
+    await send_generated_voice(bot, 42, start_daily_voice_generation(selector))
+
+    bot.send_voice.assert_not_awaited()
@@ -0,0 +1,42 @@
+"""Tests for the unified channel publisher."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from telegram.error import RetryAfter, TelegramError
+
+from src.unified import publisher
+
+
+async def test_publish_reuses_shared_bot():
+    bot = MagicMock()
+    bot.send_message = AsyncMock()
+
+    with (
+        patch.object(publisher, "UNIFIED_BOT_TOKEN", "token"),
+        patch.object(publisher, "UNIFIED_CHANNEL_ID", "-100"),
+        patch.object(publisher, "_ENABLED", True),
+        patch("src.unified.publisher.get_bot", AsyncMock(return_value=bot)) as get_bot,
+    ):
+        assert await publisher.publish_text_to_unified_channel("one")
+        assert await publisher.publish_text_to_unified_channel("two")
+
+    get_bot.assert_awaited_with("token")
+    assert bot.send_message.await_count == 2
+    text = bot.send_message.await_args.kwargs["text"]
+    assert text.startswith(publisher.BADGE)
+    assert text.endswith("two")
+
+
+# Newer python-telegram-bot warns that retry_after will become a timedelta
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_retry_delay_honors_retry_after():
+    assert publisher._retry_delay(1, RetryAfter(7)) == 7
+
+
+def test_retry_delay_backs_off_with_jitter():
+    error = TelegramError("boom")
+    for attempt in range(1, 8):
+        delay = publisher._retry_delay(attempt, error)
+        cap = min(publisher.RETRY_DELAY * 2 ** (attempt - 1), publisher.MAX_RETRY_DELAY)
+        assert 0 <= delay <= cap